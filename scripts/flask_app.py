@@ -8,38 +8,57 @@ import sys
 import threading
 import time
 import queue
-from subprocess import Popen, PIPE
+from subprocess import Popen, PIPE, STDOUT
 
 from flask import Flask, Response, request
 from flask_socketio import SocketIO, emit
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(data):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_bytes(obj) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 # -----------------------------
 # SSE broker for fallback transport
 # -----------------------------
 class SSEBroker:
     def __init__(self):
-        self._clients: list[queue.Queue] = []
+        # Copy-on-write: writers swap in a new frozenset under the lock, while
+        # broadcast reads the current reference without locking. Set semantics
+        # keep membership checks O(1) on disconnect.
+        self._clients: frozenset[queue.Queue] = frozenset()
         self._lock = threading.Lock()
     def add_client(self) -> queue.Queue:
         q = queue.Queue()
         with self._lock:
-            self._clients.append(q)
+            self._clients = self._clients | {q}
         return q
     def remove_client(self, q: queue.Queue):
         with self._lock:
             if q in self._clients:
-                self._clients.remove(q)
+                self._clients = self._clients - {q}
     def broadcast(self, data: str):
         dead = []
-        with self._lock:
-            for q in list(self._clients):
-                try:
-                    q.put_nowait(data)
-                except Exception:
-                    dead.append(q)
-            for q in dead:
-                if q in self._clients:
-                    self._clients.remove(q)
+        for q in self._clients:
+            try:
+                q.put_nowait(data)
+            except Exception:
+                dead.append(q)
+        for q in dead:
+            self.remove_client(q)
 
 # Global broker instance
 broker = SSEBroker()
@@ -57,7 +76,7 @@ class Producer:
         self._proc: Popen | None = None
         self._lock = threading.Lock()
         self._reader: threading.Thread | None = None
-        self._stderr: threading.Thread | None = None
+        self._restart_timer: threading.Timer | None = None
 
     def _build_cmd(self) -> list[str]:
         cmd = [sys.executable, os.path.join('scripts', 'generate_sweep_small_multiples.py')]
@@ -79,39 +98,67 @@ class Producer:
         with self._lock:
             self.stop()  # ensure no duplicate
             cmd = self._build_cmd()
-            self._proc = Popen(cmd, stdout=PIPE, stderr=PIPE, bufsize=1, universal_newlines=True)
+            # stderr is folded into stdout so a single pump thread serves the child;
+            # the pipe is unbuffered binary so _iter_lines can readinto() directly
+            self._proc = Popen(cmd, stdout=PIPE, stderr=STDOUT, bufsize=0)
             self._reader = threading.Thread(target=self._pump_stdout, daemon=True)
-            self._stderr = threading.Thread(target=self._pump_stderr, daemon=True)
-            self._reader.start(); self._stderr.start()
+            self._reader.start()
+
+    def schedule_restart(self, delay: float = 0.5):
+        """Coalesce rapid control changes into a single producer restart."""
+        with self._lock:
+            if self._restart_timer is not None:
+                self._restart_timer.cancel()
+            self._restart_timer = threading.Timer(delay, self.start)
+            self._restart_timer.daemon = True
+            self._restart_timer.start()
+
+    def _publish(self, raw: bytes):
+        # Socket.IO: ship the encoded JSON as a binary attachment so the
+        # server never re-encodes it; the browser JSON.parses it natively.
+        self.socketio.emit('event_raw', raw)
+        # SSE
+        broker.broadcast(raw.decode('utf-8'))
+
+    @staticmethod
+    def _iter_lines(stream, bufsize: int = 65536):
+        """Yield raw lines from a binary stream, reading into one reused buffer."""
+        buf = bytearray(bufsize)
+        mv = memoryview(buf)
+        carry = bytearray()
+        while True:
+            n = stream.readinto(buf)
+            if not n:
+                break
+            start = 0
+            while True:
+                nl = buf.find(b'\n', start, n)
+                if nl < 0:
+                    carry += mv[start:n]
+                    break
+                carry += mv[start:nl]
+                yield bytes(carry)
+                carry.clear()
+                start = nl + 1
+        if carry:
+            yield bytes(carry)
 
     def _pump_stdout(self):
         assert self._proc is not None
-        for line in self._proc.stdout:
+        for line in self._iter_lines(self._proc.stdout):
             line = line.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                # Validate only; the producer's own bytes are forwarded as-is
+                _loads(line)
+                raw = line
             except Exception:
-                obj = {"type": "log", "message": line}
-            # Socket.IO
-            self.socketio.emit('event', obj)
-            # SSE
-            broker.broadcast(json.dumps(obj))
-        done_evt = {"type": "producer_done", "ts": time.time()}
-        self.socketio.emit('event', done_evt)
-        broker.broadcast(json.dumps(done_evt))
-
-    def _pump_stderr(self):
-        if not self._proc or not self._proc.stderr:
-            return
-        for line in self._proc.stderr:
-            line = line.strip()
-            if not line:
-                continue
-            evt = {"type": "stderr", "message": line}
-            self.socketio.emit('event', evt)
-            broker.broadcast(json.dumps(evt))
+                # The child runs with --json-only, so non-JSON output is
+                # diagnostics from its (merged) stderr stream
+                raw = _dumps_bytes({"type": "stderr", "message": line.decode('utf-8', errors='replace')})
+            self._publish(raw)
+        self._publish(_dumps_bytes({"type": "producer_done", "ts": time.time()}))
 
     def stop(self):
         if self._proc and self._proc.poll() is None:
@@ -279,8 +326,14 @@ INDEX_HTML = """
   // Prefer Socket.IO if available, otherwise fall back to SSE
   if (typeof io !== 'undefined'){
     const socket = io();
+    const utf8 = new TextDecoder();
     socket.on('connect',()=>{ row(Date.now(),'socket','connected'); });
     socket.on('event',(o)=> handle(o));
+    // Producer events arrive as pre-encoded JSON bytes
+    socket.on('event_raw',(buf)=>{
+      const txt = (typeof buf === 'string') ? buf : utf8.decode(buf);
+      try{ handle(JSON.parse(txt)); }catch(e){ handle({type:'log', raw: txt}); }
+    });
     socket.on('disconnect',()=>{ row(Date.now(),'socket','disconnected'); });
     // controls
     presetSel.addEventListener('change',()=>{ socket.emit('control', {action:'set_preset', preset:presetSel.value}); });
@@ -390,10 +443,10 @@ def on_control(data):
         action = data.get('action')
         if action == 'set_preset':
             producer.preset = data.get('preset','accuracy')
-            producer.start()
+            producer.schedule_restart()
         elif action == 'set_no_artifacts':
             producer.no_artifacts = bool(data.get('value'))
-            producer.start()
+            producer.schedule_restart()
 
 
 def main():
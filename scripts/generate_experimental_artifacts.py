@@ -6,14 +6,460 @@ Creates datasets, supplementary materials, and experimental artifacts for public
 
 import numpy as np
 import pandas as pd
+import argparse
 import json
 import csv
+import bisect
+import hashlib
+import concurrent.futures
 from pathlib import Path
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
+import io
 import zipfile
-import shutil
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Brain-region layout of the 1M-neuron network: upper neuron-ID bound (exclusive)
+# of every region except the last, and the region names in ID order
+_REGION_BOUNDS = (200000, 400000, 550000, 670000, 790000, 870000, 950000)
+_REGION_NAMES = ('Visual_Cortex', 'Prefrontal_Cortex', 'Auditory_Cortex', 'Motor_Cortex',
+                 'Hippocampus', 'Thalamus', 'Cerebellum', 'Brainstem')
+_CONNECTION_TYPES = ['excitatory', 'inhibitory']
+
+# Fixed experiment tables (scaling test results and Tables S1-S3), stored
+# row-wise and written without pandas
+_SCALING_COLUMNS = ('neuron_count', 'steps_per_second', 'memory_usage_mb', 'processing_time_ms', 'connections', 'assemblies_detected', 'success_rate', 'learning_updates', 'hebbian_percentage', 'stdp_percentage')
+_SCALING_ROWS = (
+    (64, 49.0, 0.004, 20.4, 12, 0, 1.0, 5, 0.0, 0.0),
+    (1000, 49.2, 0.064, 20.3, 45, 1, 1.0, 23, 72.5, 27.5),
+    (5000, 24.7, 0.32, 40.4, 156, 2, 1.0, 67, 74.2, 25.8),
+    (10000, 12.5, 0.64, 80.3, 212, 6, 1.0, 89, 75.8, 24.2),
+    (25000, 10.0, 1.6, 100.0, 190, 4, 1.0, 78, 76.1, 23.9),
+    (50000, 5.0, 3.2, 200.0, 195, 5, 1.0, 85, 74.9, 25.1),
+    (100000, 2.0, 6.4, 500.0, 212, 6, 1.0, 92, 75.3, 24.7),
+    (500000, 0.5, 32.0, 2000.0, 212, 3, 1.0, 156, 74.7, 25.3),
+    (1000000, 0.33, 64.0, 3000.0, 190, 4, 1.0, 93, 75.3, 24.7),
+)
+
+_TABLE_S1_COLUMNS = ('Scale', 'Neurons', 'Processing_Speed_steps_per_sec', 'Memory_Usage_MB', 'Connections', 'Assemblies', 'Learning_Updates', 'Success_Rate', 'Execution_Time_min')
+_TABLE_S1_ROWS = (
+    ('64', 64, 49.0, 0.004, 12, 0, 5, '100%', 0.03),
+    ('1K', 1000, 49.2, 0.064, 45, 1, 23, '100%', 0.03),
+    ('5K', 5000, 24.7, 0.32, 156, 2, 67, '100%', 0.07),
+    ('10K', 10000, 12.5, 0.64, 212, 6, 89, '100%', 0.13),
+    ('25K', 25000, 10.0, 1.6, 190, 4, 78, '100%', 0.17),
+    ('50K', 50000, 5.0, 3.2, 195, 5, 85, '100%', 0.33),
+    ('100K', 100000, 2.0, 6.4, 212, 6, 92, '100%', 0.83),
+    ('500K', 500000, 0.5, 32.0, 212, 3, 156, '100%', 3.33),
+    ('1M', 1000000, 0.33, 64.0, 190, 4, 93, '100%', 6.0),
+)
+
+_TABLE_S2_COLUMNS = ('Mechanism', 'Max_Scale', 'Convergence_Rate', 'Stability_Score', 'Biological_Realism', 'Assembly_Formation', 'Cross_Regional_Integration')
+_TABLE_S2_ROWS = (
+    ('STDP Only', '10K', 0.34, 0.65, 0.8, 2, 'No'),
+    ('Hebbian Only', '10K', 0.36, 0.7, 0.75, 1, 'Limited'),
+    ('Sequential', '50K', 0.32, 0.75, 0.6, 3, 'Limited'),
+    ('Weighted Combination', '100K', 0.35, 0.8, 0.7, 4, 'Yes'),
+    ('Unified Coordination', '1M', 0.42, 0.95, 0.9, 6, 'Yes'),
+)
+
+_TABLE_S3_COLUMNS = ('Component', 'Specification', 'Version')
+_TABLE_S3_ROWS = (
+    ('Operating System', 'Windows 11', 'Build 22000+'),
+    ('Total RAM', '7.84 GB', 'DDR4'),
+    ('Available Disk Space', '11.48 GB', 'SSD'),
+    ('Processor', 'Multi-core x64', 'Variable'),
+    ('Architecture', 'Unified Neural Substrate', 'v1.0'),
+    ('Compiler', 'MSVC C++20', '2022+'),
+    ('Dependencies', "OpenCV, Cap'n Proto, SQLite3", 'Latest stable'),
+)
+
+# Static code/documentation artifacts shipped verbatim in the archive
+_ANALYSIS_SCRIPT_PY = '''#!/usr/bin/env python3
+"""
+NeuroForge Results Analysis Script
+Reproduces key analyses from the paper
+"""
+
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+from pathlib import Path
+
+def load_scaling_data():
+    """Load scaling performance data."""
+    return pd.read_csv("datasets/scaling_performance.csv")
+
+def analyze_scaling_performance():
+    """Analyze scaling performance characteristics."""
+    df = load_scaling_data()
+    
+    # Memory scaling analysis
+    memory_slope = np.polyfit(np.log10(df['neuron_count']), np.log10(df['memory_usage_mb']), 1)[0]
+    print(f"Memory scaling exponent: {memory_slope:.3f}")
+    
+    # Processing time analysis
+    time_slope = np.polyfit(np.log10(df['neuron_count']), np.log10(df['processing_time_ms']), 1)[0]
+    print(f"Processing time scaling exponent: {time_slope:.3f}")
+    
+    return df
+
+def analyze_learning_convergence():
+    """Analyze learning mechanism convergence."""
+    df = pd.read_csv("datasets/learning_convergence.csv")
+    
+    # Final performance comparison
+    final_stdp = df['stdp_only_reward'].iloc[-1]
+    final_hebbian = df['hebbian_only_reward'].iloc[-1]
+    final_unified = df['unified_reward'].iloc[-1]
+    
+    print(f"Final STDP performance: {final_stdp:.3f}")
+    print(f"Final Hebbian performance: {final_hebbian:.3f}")
+    print(f"Final unified performance: {final_unified:.3f}")
+    print(f"Improvement over STDP: {(final_unified - final_stdp)/final_stdp*100:.1f}%")
+    print(f"Improvement over Hebbian: {(final_unified - final_hebbian)/final_hebbian*100:.1f}%")
+
+def analyze_assembly_formation():
+    """Analyze neural assembly characteristics."""
+    df = pd.read_csv("datasets/neural_assemblies.csv")
+    
+    # Assembly statistics by scale
+    stats = df.groupby('scale').agg({
+        'size': ['mean', 'std', 'count'],
+        'cohesion_score': ['mean', 'std'],
+        'cross_regional': 'mean'
+    }).round(3)
+    
+    print("Assembly statistics by scale:")
+    print(stats)
+
+if __name__ == "__main__":
+    print("NeuroForge Results Analysis")
+    print("=" * 30)
+    
+    analyze_scaling_performance()
+    print()
+    analyze_learning_convergence()
+    print()
+    analyze_assembly_formation()
+'''
+
+_STATISTICAL_ANALYSIS_R = '''# NeuroForge Statistical Analysis in R
+# Reproduces statistical analyses from the paper
+
+library(ggplot2)
+library(dplyr)
+library(readr)
+
+# Load data
+scaling_data <- read_csv("datasets/scaling_performance.csv")
+learning_data <- read_csv("datasets/learning_convergence.csv")
+assembly_data <- read_csv("datasets/neural_assemblies.csv")
+
+# Scaling analysis
+scaling_model <- lm(log10(memory_usage_mb) ~ log10(neuron_count), data = scaling_data)
+print("Memory scaling model:")
+print(summary(scaling_model))
+
+# Learning convergence analysis
+learning_comparison <- learning_data %>%
+  summarise(
+    stdp_final = last(stdp_only_reward),
+    hebbian_final = last(hebbian_only_reward),
+    unified_final = last(unified_reward)
+  )
+
+print("Learning convergence comparison:")
+print(learning_comparison)
+
+# Assembly formation analysis
+assembly_stats <- assembly_data %>%
+  group_by(scale) %>%
+  summarise(
+    mean_size = mean(size),
+    mean_cohesion = mean(cohesion_score),
+    cross_regional_pct = mean(cross_regional) * 100,
+    .groups = 'drop'
+  )
+
+print("Assembly statistics by scale:")
+print(assembly_stats)
+'''
+
+_REPRODUCTION_GUIDE_MD = '''# NeuroForge Reproduction Guide
+
+## Overview
+This guide provides step-by-step instructions for reproducing the experimental results presented in the NeuroForge papers.
+
+## System Requirements
+- Windows 11 (or compatible OS)
+- Minimum 8GB RAM (16GB recommended)
+- 2GB free disk space
+- C++20 compatible compiler
+- Python 3.8+ with required packages
+
+## Installation
+1. Clone the NeuroForge repository
+2. Install dependencies: OpenCV, Cap'n Proto, SQLite3
+3. Build the system using CMake
+4. Verify installation with basic tests
+
+## Reproducing Scaling Experiments
+
+### Basic Scaling Test (64 to 100K neurons)
+```bash
+# Run basic scaling test
+powershell -ExecutionPolicy Bypass -File "scripts\\basic_scaling_test.ps1" -MaxNeurons 100000
+```
+
+### Million Neuron Test
+```bash
+# Run million neuron test (requires significant time and memory)
+powershell -ExecutionPolicy Bypass -File "scripts\\million_neuron_test.ps1"
+```
+
+### Expected Results
+- 100% completion rate across all scales
+- Linear memory scaling (64 bytes per neuron)
+- Predictable processing time scaling
+- Neural assembly formation at larger scales
+
+## Reproducing Learning Experiments
+
+### Learning Mechanism Comparison
+```bash
+# Test individual mechanisms
+.\\build\\Release\\neuroforge.exe --steps=1000 --learning-mode=stdp
+.\\build\\Release\\neuroforge.exe --steps=1000 --learning-mode=hebbian
+.\\build\\Release\\neuroforge.exe --steps=1000 --learning-mode=unified
+```
+
+### Expected Results
+- Unified learning shows superior convergence
+- Optimal distribution: ~75% Hebbian, ~25% STDP
+- Improved stability and performance
+
+## Reproducing Assembly Analysis
+
+### Assembly Detection
+```bash
+# Run with assembly detection enabled
+python scripts\\assembly_detector.py connectivity_data.csv --threshold 0.1
+```
+
+### Expected Results
+- Assembly formation at all scales > 1K neurons
+- Cross-regional integration
+- Stable assembly characteristics
+
+## Data Analysis
+
+### Statistical Analysis
+```bash
+# Run analysis scripts
+python code/analyze_results.py
+Rscript code/statistical_analysis.R
+```
+
+### Visualization
+```bash
+# Generate figures
+python scripts/generate_publication_figures.py
+```
+
+## Troubleshooting
+
+### Common Issues
+1. **Memory limitations**: Reduce neuron count or increase system RAM
+2. **Compilation errors**: Verify C++20 compiler and dependencies
+3. **Performance issues**: Check system resources and background processes
+4. **Assembly detection failures**: Adjust threshold parameters
+
+### Performance Optimization
+- Use Release build configuration
+- Close unnecessary applications
+- Ensure adequate free disk space
+- Monitor system temperature
+
+## Validation Criteria
+
+### Scaling Tests
+- [ ] All tests complete without crashes
+- [ ] Memory usage scales linearly
+- [ ] Processing time scales predictably
+- [ ] Assembly detection functions correctly
+
+### Learning Tests
+- [ ] Convergence achieved within expected timeframe
+- [ ] Learning distribution matches expected ratios
+- [ ] Stability maintained throughout training
+
+### Assembly Tests
+- [ ] Assemblies detected at appropriate scales
+- [ ] Assembly characteristics within expected ranges
+- [ ] Cross-regional integration observed
+
+## Support
+For issues or questions regarding reproduction:
+1. Check system requirements and installation
+2. Verify input data format and parameters
+3. Review troubleshooting section
+4. Contact authors with detailed error information
+
+## Citation
+If you use this code or reproduce these results, please cite:
+[Paper citations will be added upon publication]
+'''
+
+# Fixed result summaries and manifest sections; only the manifest timestamp varies per run
+_MAIN_RESULTS = {
+    'experiment_overview': {
+        'title': 'NeuroForge: Unified Neural Substrate Architecture',
+        'date': '2025-01-28',
+        'duration': '6 months development + 2 months testing',
+        'total_experiments': 156,
+        'successful_experiments': 156,
+        'success_rate': '100%'
+    },
+    'key_achievements': {
+        'maximum_scale': '1,000,000 neurons',
+        'system_stability': '100% across all scales',
+        'memory_efficiency': '64 bytes per neuron',
+        'learning_integration': 'STDP + Hebbian coordination',
+        'assembly_formation': 'Up to 6 assemblies detected',
+        'biological_realism': 'Maintained at all scales'
+    },
+    'performance_highlights': {
+        'linear_memory_scaling': True,
+        'predictable_processing_time': True,
+        'stable_learning_convergence': True,
+        'robust_assembly_detection': True,
+        'cross_regional_integration': True
+    },
+    'technical_innovations': [
+        'Unified neural substrate architecture',
+        'Coordinated STDP-Hebbian learning',
+        'Sparse connectivity optimization',
+        'Real-time assembly detection',
+        'Linear memory scaling algorithms'
+    ],
+    'scientific_contributions': [
+        'First million-neuron biological AI demonstration',
+        'Optimal learning mechanism distribution discovery',
+        'Scalable neural assembly formation validation',
+        'Unified substrate architecture proof-of-concept',
+        'Brain-scale simulation feasibility demonstration'
+    ]
+}
+
+_PERFORMANCE_BENCHMARKS = {
+    'scaling_benchmarks': {
+        '64_neurons': {'time': '20.4ms/step', 'memory': '4KB', 'assemblies': 0},
+        '1K_neurons': {'time': '20.3ms/step', 'memory': '64KB', 'assemblies': 1},
+        '10K_neurons': {'time': '80.3ms/step', 'memory': '640KB', 'assemblies': 6},
+        '100K_neurons': {'time': '500ms/step', 'memory': '6.4MB', 'assemblies': 6},
+        '1M_neurons': {'time': '3000ms/step', 'memory': '64MB', 'assemblies': 4}
+    },
+    'learning_benchmarks': {
+        'stdp_only': {'convergence': 0.34, 'stability': 0.65, 'time': '15min'},
+        'hebbian_only': {'convergence': 0.36, 'stability': 0.70, 'time': '12min'},
+        'unified': {'convergence': 0.42, 'stability': 0.95, 'time': '8min'}
+    },
+    'assembly_benchmarks': {
+        'formation_rate': '3x higher with coordinated learning',
+        'stability_improvement': '60% better persistence',
+        'coherence_improvement': '45% higher internal connectivity',
+        'cross_regional_percentage': '70% of assemblies span regions'
+    }
+}
+
+_MANIFEST_BODY = {
+    'contents': {
+        'datasets': [
+            'scaling_performance.csv - Scaling test results',
+            'learning_convergence.csv - Learning mechanism comparison',
+            'neural_assemblies.csv - Assembly formation data',
+            'connectivity_matrix.csv - Network connectivity data'
+        ],
+        'supplementary': [
+            'table_s1_performance_metrics.csv - Detailed performance table',
+            'table_s2_learning_comparison.csv - Learning mechanism comparison',
+            'table_s3_system_specifications.csv - System requirements',
+            'parameter_specifications.json - All model parameters',
+            'experimental_protocols.json - Detailed protocols'
+        ],
+        'code': [
+            'analyze_results.py - Python analysis script',
+            'statistical_analysis.R - R statistical analysis'
+        ],
+        'results': [
+            'main_results_summary.json - Key findings summary',
+            'performance_benchmarks.json - Performance benchmarks'
+        ],
+        'documentation': [
+            'REPRODUCTION_GUIDE.md - Step-by-step reproduction guide'
+        ]
+    },
+    'usage_instructions': [
+        '1. Extract archive to desired location',
+        '2. Install required dependencies (Python, R, NeuroForge)',
+        '3. Follow REPRODUCTION_GUIDE.md for step-by-step instructions',
+        '4. Run analysis scripts to reproduce key results',
+        '5. Refer to supplementary materials for detailed parameters'
+    ]
+}
+
+# Records the source digest and file list of the last completed run
+_ARTIFACT_HASH_FILE = ".artifact_hash"
+_ARCHIVE_NAME = "neuroforge_experimental_artifacts.zip"
+
+def _source_key() -> str:
+    """Digest of this module's source, which holds every input to the artifacts."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+def _json_default(obj):
+    """Fallback encoder for NumPy scalars when orjson is unavailable."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps_json(obj) -> bytes:
+    """Encode obj as 2-space indented, newline-terminated JSON (orjson when installed,
+    NumPy scalars allowed). Written in binary mode, so no newline translation applies."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=(orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                                         | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+    return (json.dumps(obj, indent=2, default=_json_default) + '\n').encode()
+
+def _csv_bytes(columns, rows) -> bytes:
+    """Render a fixed header + rows table as CSV (minimal quoting, LF line endings)."""
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator='\n')
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return buf.getvalue().encode()
+
+def _summarize(arr, median: bool = True) -> dict:
+    """mean/std/min/max (plus median) of a 1-D array; std uses ddof=1 like pandas."""
+    arr = np.ascontiguousarray(arr)
+    stats = {'mean': arr.mean(), 'std': arr.std(ddof=1), 'min': arr.min(), 'max': arr.max()}
+    if median:
+        stats['median'] = np.median(arr)
+    return stats
+
+def _saturating_curve(steps, amplitude, tau, noise):
+    """amplitude * (1 - exp(-steps/tau)) + noise, evaluated in a single buffer."""
+    out = np.divide(steps, -tau)
+    np.exp(out, out=out)
+    np.subtract(1.0, out, out=out)
+    out *= amplitude
+    out += noise
+    return out
 
 class ExperimentalArtifactsGenerator:
     """Generates experimental artifacts and supplementary materials."""
@@ -28,15 +474,43 @@ class ExperimentalArtifactsGenerator:
         (self.output_dir / "code").mkdir(exist_ok=True)
         (self.output_dir / "results").mkdir(exist_ok=True)
         
-    def generate_all_artifacts(self):
-        """Generate all experimental artifacts."""
+        # (archive name, contents) of every artifact written, for the zip
+        self._artifacts: list[tuple[str, bytes]] = []
+        
+    def _write_artifact(self, relpath: str, data: bytes):
+        """Write one artifact under output_dir and keep its bytes for the archive."""
+        (self.output_dir / relpath).write_bytes(data)
+        self._artifacts.append((relpath, data))
+    
+    def _write_json(self, relpath: str, obj):
+        """Write obj as a JSON artifact."""
+        self._write_artifact(relpath, _dumps_json(obj))
+    
+    def _is_up_to_date(self, key: str) -> bool:
+        """True when a run of the same source already left every artifact in place."""
+        try:
+            stored_key, *relpaths = (self.output_dir / _ARTIFACT_HASH_FILE).read_text().splitlines()
+        except (OSError, ValueError):
+            return False
+        return stored_key == key and all((self.output_dir / p).is_file() for p in relpaths)
+    
+    def generate_all_artifacts(self, force: bool = False):
+        """Generate all experimental artifacts (skipped if unchanged, unless force)."""
+        key = _source_key()
+        if not force and self._is_up_to_date(key):
+            print(f"Artifacts in {self.output_dir} are up to date; skipping regeneration")
+            return
+        
         print("Generating experimental artifacts...")
         
-        # Generate datasets
-        self.generate_scaling_dataset()
-        self.generate_learning_dataset()
-        self.generate_assembly_dataset()
-        self.generate_connectivity_dataset()
+        # Generate datasets (independent, disjoint outputs: run them concurrently)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as ex:
+            futures = [ex.submit(m) for m in (self.generate_scaling_dataset,
+                                              self.generate_learning_dataset,
+                                              self.generate_assembly_dataset,
+                                              self.generate_connectivity_dataset)]
+            for future in futures:
+                future.result()
         
         # Generate supplementary materials
         self.generate_supplementary_tables()
@@ -53,28 +527,16 @@ class ExperimentalArtifactsGenerator:
         # Create archive
         self.create_artifact_archive()
         
+        relpaths = [name for name, _ in self._artifacts] + [_ARCHIVE_NAME]
+        (self.output_dir / _ARTIFACT_HASH_FILE).write_text('\n'.join([key] + relpaths) + '\n')
+        
         print(f"All artifacts generated in: {self.output_dir}")
     
     def generate_scaling_dataset(self):
         """Generate scaling performance dataset."""
         print("  Generating scaling dataset...")
         
-        # Scaling test data based on our experiments
-        scaling_data = {
-            'neuron_count': [64, 1000, 5000, 10000, 25000, 50000, 100000, 500000, 1000000],
-            'steps_per_second': [49.0, 49.2, 24.7, 12.5, 10.0, 5.0, 2.0, 0.5, 0.33],
-            'memory_usage_mb': [0.004, 0.064, 0.32, 0.64, 1.6, 3.2, 6.4, 32, 64],
-            'processing_time_ms': [20.4, 20.3, 40.4, 80.3, 100, 200, 500, 2000, 3000],
-            'connections': [12, 45, 156, 212, 190, 195, 212, 212, 190],
-            'assemblies_detected': [0, 1, 2, 6, 4, 5, 6, 3, 4],
-            'success_rate': [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
-            'learning_updates': [5, 23, 67, 89, 78, 85, 92, 156, 93],
-            'hebbian_percentage': [0.0, 72.5, 74.2, 75.8, 76.1, 74.9, 75.3, 74.7, 75.3],
-            'stdp_percentage': [0.0, 27.5, 25.8, 24.2, 23.9, 25.1, 24.7, 25.3, 24.7]
-        }
-        
-        df = pd.DataFrame(scaling_data)
-        df.to_csv(self.output_dir / "datasets" / "scaling_performance.csv", index=False)
+        self._write_artifact("datasets/scaling_performance.csv", _csv_bytes(_SCALING_COLUMNS, _SCALING_ROWS))
         
         # Add metadata
         metadata = {
@@ -106,8 +568,7 @@ class ExperimentalArtifactsGenerator:
             }
         }
         
-        with open(self.output_dir / "datasets" / "scaling_metadata.json", 'w') as f:
-            json.dump(metadata, f, indent=2)
+        self._write_json("datasets/scaling_metadata.json", metadata)
     
     def generate_learning_dataset(self):
         """Generate learning convergence dataset."""
@@ -116,25 +577,30 @@ class ExperimentalArtifactsGenerator:
         # Simulated learning curves based on our results
         steps = np.arange(0, 1000, 10)
         
-        # Generate learning curves for different mechanisms
-        np.random.seed(42)
+        # Generate learning curves for different mechanisms; all Gaussian noise
+        # (three reward curves, three weight-change series) comes from one draw
+        rng = np.random.default_rng(42)
+        noise = rng.standard_normal((6, len(steps)))
         
-        stdp_only = 0.36 * (1 - np.exp(-steps/200)) + np.random.normal(0, 0.02, len(steps))
-        hebbian_only = 0.34 * (1 - np.exp(-steps/150)) + np.random.normal(0, 0.015, len(steps))
-        unified = 0.75 * hebbian_only + 0.25 * stdp_only + np.random.normal(0, 0.01, len(steps))
+        noise[:3] *= np.array([[0.02], [0.015], [0.01]])
+        stdp_only = _saturating_curve(steps, 0.36, 200, noise[0])
+        hebbian_only = _saturating_curve(steps, 0.34, 150, noise[1])
+        unified = 0.75 * hebbian_only
+        unified += 0.25 * stdp_only
+        unified += noise[2]
         
         learning_data = {
             'step': steps,
             'stdp_only_reward': np.maximum(0, stdp_only),
             'hebbian_only_reward': np.maximum(0, hebbian_only),
             'unified_reward': np.maximum(0, unified),
-            'stdp_weight_changes': np.abs(np.random.normal(0.0002, 0.00005, len(steps))),
-            'hebbian_weight_changes': np.abs(np.random.normal(0.0003, 0.00008, len(steps))),
-            'unified_weight_changes': np.abs(np.random.normal(0.000267, 0.00006, len(steps)))
+            'stdp_weight_changes': np.abs(0.0002 + 0.00005 * noise[3]),
+            'hebbian_weight_changes': np.abs(0.0003 + 0.00008 * noise[4]),
+            'unified_weight_changes': np.abs(0.000267 + 0.00006 * noise[5])
         }
         
         df = pd.DataFrame(learning_data)
-        df.to_csv(self.output_dir / "datasets" / "learning_convergence.csv", index=False)
+        self._write_artifact("datasets/learning_convergence.csv", df.to_csv(index=False).encode())
         
         # Learning mechanism statistics
         learning_stats = {
@@ -144,183 +610,134 @@ class ExperimentalArtifactsGenerator:
                 'confidence_interval': [73.2, 76.8]
             },
             'convergence_metrics': {
-                'stdp_only_final': float(stdp_only[-1]),
-                'hebbian_only_final': float(hebbian_only[-1]),
-                'unified_final': float(unified[-1]),
-                'improvement_over_stdp': float((unified[-1] - stdp_only[-1]) / stdp_only[-1] * 100),
-                'improvement_over_hebbian': float((unified[-1] - hebbian_only[-1]) / hebbian_only[-1] * 100)
+                'stdp_only_final': stdp_only[-1],
+                'hebbian_only_final': hebbian_only[-1],
+                'unified_final': unified[-1],
+                'improvement_over_stdp': (unified[-1] - stdp_only[-1]) / stdp_only[-1] * 100,
+                'improvement_over_hebbian': (unified[-1] - hebbian_only[-1]) / hebbian_only[-1] * 100
             },
             'stability_metrics': {
-                'stdp_variance': float(np.var(stdp_only[-100:])),
-                'hebbian_variance': float(np.var(hebbian_only[-100:])),
-                'unified_variance': float(np.var(unified[-100:]))
+                'stdp_variance': np.var(stdp_only[-100:]),
+                'hebbian_variance': np.var(hebbian_only[-100:]),
+                'unified_variance': np.var(unified[-100:])
             }
         }
         
-        with open(self.output_dir / "datasets" / "learning_statistics.json", 'w') as f:
-            json.dump(learning_stats, f, indent=2)
+        self._write_json("datasets/learning_statistics.json", learning_stats)
     
     def generate_assembly_dataset(self):
         """Generate neural assembly formation dataset."""
         print("  Generating assembly dataset...")
         
         # Assembly formation data based on our experiments
-        assembly_data = []
-        
-        # Generate assembly data for different scales
-        scales = [1000, 5000, 10000, 50000, 100000, 500000, 1000000]
-        
-        for scale in scales:
-            num_assemblies = max(1, int(np.log10(scale) - 1))
-            
-            for i in range(num_assemblies):
-                assembly = {
-                    'scale': scale,
-                    'assembly_id': i,
-                    'size': np.random.randint(3, max(4, min(50, scale//1000))),
-                    'cohesion_score': np.random.uniform(1.2, 3.5),
-                    'internal_strength': np.random.uniform(0.3, 0.9),
-                    'external_strength': np.random.uniform(0.05, 0.3),
-                    'stability_score': np.random.uniform(0.6, 0.95),
-                    'formation_time': np.random.randint(10, 100),
-                    'cross_regional': np.random.choice([True, False], p=[0.7, 0.3]),
-                    'persistence': np.random.uniform(0.5, 1.0)
-                }
-                assembly_data.append(assembly)
-        
-        df = pd.DataFrame(assembly_data)
-        df.to_csv(self.output_dir / "datasets" / "neural_assemblies.csv", index=False)
+        scales = np.array([1000, 5000, 10000, 50000, 100000, 500000, 1000000], dtype=np.uint32)
+        counts = np.array([max(1, int(np.log10(scale) - 1)) for scale in scales])
+        total = int(counts.sum())
+
+        # One row per assembly; every column is drawn in a single call, in the
+        # narrowest dtype that holds it (CSV output is text either way)
+        rng = np.random.default_rng(42)
+        scale_col = np.repeat(scales, counts)
+        hi = np.clip(scale_col // 1000, 4, 50).astype(np.int64)
+        sizes = rng.integers(3, hi, dtype=np.int32)
+        cohesion = rng.uniform(1.2, 3.5, total).astype(np.float32)
+        internal = rng.uniform(0.3, 0.9, total).astype(np.float32)
+        external = rng.uniform(0.05, 0.3, total).astype(np.float32)
+        stability = rng.uniform(0.6, 0.95, total).astype(np.float32)
+        formation = rng.integers(10, 100, total, dtype=np.int32)
+        cross_regional = rng.random(total) < 0.7
+        persistence = rng.uniform(0.5, 1.0, total).astype(np.float32)
+
+        # The DataFrame is only a thin wrapper for the CSV writer
+        df = pd.DataFrame({
+            'scale': scale_col,
+            'assembly_id': np.concatenate([np.arange(c, dtype=np.int32) for c in counts]),
+            'size': sizes,
+            'cohesion_score': cohesion,
+            'internal_strength': internal,
+            'external_strength': external,
+            'stability_score': stability,
+            'formation_time': formation,
+            'cross_regional': cross_regional,
+            'persistence': persistence
+        })
+        self._write_artifact("datasets/neural_assemblies.csv", df.to_csv(index=False).encode())
         
-        # Assembly statistics
+        # Assembly statistics, reduced straight from the column arrays
         assembly_stats = {
-            'size_distribution': {
-                'mean': float(df['size'].mean()),
-                'std': float(df['size'].std()),
-                'min': int(df['size'].min()),
-                'max': int(df['size'].max()),
-                'median': float(df['size'].median())
-            },
-            'cohesion_distribution': {
-                'mean': float(df['cohesion_score'].mean()),
-                'std': float(df['cohesion_score'].std()),
-                'min': float(df['cohesion_score'].min()),
-                'max': float(df['cohesion_score'].max())
-            },
-            'cross_regional_percentage': float(df['cross_regional'].mean() * 100),
-            'assemblies_by_scale': df.groupby('scale').size().to_dict()
+            'size_distribution': _summarize(sizes),
+            'cohesion_distribution': _summarize(cohesion, median=False),
+            'cross_regional_percentage': cross_regional.mean() * 100,
+            # Rows are laid out per scale, so the group sizes are the draw counts
+            'assemblies_by_scale': dict(zip(scales.tolist(), counts.tolist()))
         }
         
-        with open(self.output_dir / "datasets" / "assembly_statistics.json", 'w') as f:
-            json.dump(assembly_stats, f, indent=2)
+        self._write_json("datasets/assembly_statistics.json", assembly_stats)
     
     def generate_connectivity_dataset(self):
         """Generate connectivity pattern dataset."""
         print("  Generating connectivity dataset...")
         
         # Simulated connectivity data for 1M neuron network
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         
         # Generate sparse connectivity based on our results
         num_connections = 190
-        neuron_ids = np.random.choice(1000000, size=num_connections*2, replace=False)
-        
-        connectivity_data = []
-        for i in range(num_connections):
-            pre_neuron = neuron_ids[i*2]
-            post_neuron = neuron_ids[i*2 + 1]
-            weight = np.random.uniform(0.1, 0.9)
-            
-            connectivity_data.append({
-                'pre_neuron': pre_neuron,
-                'post_neuron': post_neuron,
-                'weight': weight,
-                'connection_type': np.random.choice(['excitatory', 'inhibitory'], p=[0.8, 0.2]),
-                'region_pre': self.get_region_for_neuron(pre_neuron),
-                'region_post': self.get_region_for_neuron(post_neuron),
-                'distance': np.random.exponential(100),  # Connection distance
-                'formation_time': np.random.randint(0, 1000)
-            })
-        
-        df = pd.DataFrame(connectivity_data)
-        df.to_csv(self.output_dir / "datasets" / "connectivity_matrix.csv", index=False)
-        
-        # Connectivity statistics
+        # Neuron IDs fit in uint32 and scores in float32
+        pre_neuron, post_neuron = rng.choice(1000000, size=(2, num_connections), replace=False).astype(np.uint32)
+        
+        weights = rng.uniform(0.1, 0.9, num_connections).astype(np.float32)
+        # Small fixed vocabularies: kept as integer codes, not per-cell strings
+        type_codes = (rng.random(num_connections) >= 0.8).astype(np.int8)
+        region_pre = np.searchsorted(_REGION_BOUNDS, pre_neuron, side='right')
+        region_post = np.searchsorted(_REGION_BOUNDS, post_neuron, side='right')
+        
+        # The DataFrame is only a thin wrapper for the CSV writer
+        df = pd.DataFrame({
+            'pre_neuron': pre_neuron,
+            'post_neuron': post_neuron,
+            'weight': weights,
+            'connection_type': pd.Categorical.from_codes(type_codes, _CONNECTION_TYPES),
+            'region_pre': pd.Categorical.from_codes(region_pre, _REGION_NAMES),
+            'region_post': pd.Categorical.from_codes(region_post, _REGION_NAMES),
+            'distance': rng.exponential(100, num_connections).astype(np.float32),  # Connection distance
+            'formation_time': rng.integers(0, 1000, num_connections, dtype=np.int32)
+        })
+        self._write_artifact("datasets/connectivity_matrix.csv", df.to_csv(index=False).encode())
+        
+        # Connectivity statistics, reduced straight from the column arrays;
+        # regions are listed in order of first appearance
+        first_seen = np.sort(np.unique(region_pre, return_index=True)[1])
         connectivity_stats = {
-            'total_connections': len(connectivity_data),
-            'density': len(connectivity_data) / (1000000 * 1000000) * 100,
-            'weight_distribution': {
-                'mean': float(df['weight'].mean()),
-                'std': float(df['weight'].std()),
-                'min': float(df['weight'].min()),
-                'max': float(df['weight'].max())
-            },
-            'connection_types': df['connection_type'].value_counts().to_dict(),
-            'inter_regional_percentage': float((df['region_pre'] != df['region_post']).mean() * 100),
-            'regions': df['region_pre'].unique().tolist()
+            'total_connections': num_connections,
+            'density': num_connections / (1000000 * 1000000) * 100,
+            'weight_distribution': _summarize(weights, median=False),
+            'connection_types': dict(zip(_CONNECTION_TYPES, np.bincount(type_codes, minlength=2).tolist())),
+            'inter_regional_percentage': (region_pre != region_post).mean() * 100,
+            'regions': [_REGION_NAMES[code] for code in region_pre[first_seen]]
         }
         
-        with open(self.output_dir / "datasets" / "connectivity_statistics.json", 'w') as f:
-            json.dump(connectivity_stats, f, indent=2)
+        self._write_json("datasets/connectivity_statistics.json", connectivity_stats)
     
     def get_region_for_neuron(self, neuron_id):
         """Map neuron ID to brain region."""
-        if neuron_id < 200000:
-            return 'Visual_Cortex'
-        elif neuron_id < 400000:
-            return 'Prefrontal_Cortex'
-        elif neuron_id < 550000:
-            return 'Auditory_Cortex'
-        elif neuron_id < 670000:
-            return 'Motor_Cortex'
-        elif neuron_id < 790000:
-            return 'Hippocampus'
-        elif neuron_id < 870000:
-            return 'Thalamus'
-        elif neuron_id < 950000:
-            return 'Cerebellum'
-        else:
-            return 'Brainstem'
+        return _REGION_NAMES[bisect.bisect_right(_REGION_BOUNDS, neuron_id)]
     
     def generate_supplementary_tables(self):
         """Generate supplementary tables for papers."""
         print("  Generating supplementary tables...")
         
         # Table S1: Detailed performance metrics
-        performance_table = pd.DataFrame({
-            'Scale': ['64', '1K', '5K', '10K', '25K', '50K', '100K', '500K', '1M'],
-            'Neurons': [64, 1000, 5000, 10000, 25000, 50000, 100000, 500000, 1000000],
-            'Processing_Speed_steps_per_sec': [49.0, 49.2, 24.7, 12.5, 10.0, 5.0, 2.0, 0.5, 0.33],
-            'Memory_Usage_MB': [0.004, 0.064, 0.32, 0.64, 1.6, 3.2, 6.4, 32, 64],
-            'Connections': [12, 45, 156, 212, 190, 195, 212, 212, 190],
-            'Assemblies': [0, 1, 2, 6, 4, 5, 6, 3, 4],
-            'Learning_Updates': [5, 23, 67, 89, 78, 85, 92, 156, 93],
-            'Success_Rate': ['100%'] * 9,
-            'Execution_Time_min': [0.03, 0.03, 0.07, 0.13, 0.17, 0.33, 0.83, 3.33, 6.0]
-        })
-        
-        performance_table.to_csv(self.output_dir / "supplementary" / "table_s1_performance_metrics.csv", index=False)
+        self._write_artifact("supplementary/table_s1_performance_metrics.csv",
+                             _csv_bytes(_TABLE_S1_COLUMNS, _TABLE_S1_ROWS))
         
         # Table S2: Learning mechanism comparison
-        learning_table = pd.DataFrame({
-            'Mechanism': ['STDP Only', 'Hebbian Only', 'Sequential', 'Weighted Combination', 'Unified Coordination'],
-            'Max_Scale': ['10K', '10K', '50K', '100K', '1M'],
-            'Convergence_Rate': [0.34, 0.36, 0.32, 0.35, 0.42],
-            'Stability_Score': [0.65, 0.70, 0.75, 0.80, 0.95],
-            'Biological_Realism': [0.80, 0.75, 0.60, 0.70, 0.90],
-            'Assembly_Formation': [2, 1, 3, 4, 6],
-            'Cross_Regional_Integration': ['No', 'Limited', 'Limited', 'Yes', 'Yes']
-        })
-        
-        learning_table.to_csv(self.output_dir / "supplementary" / "table_s2_learning_comparison.csv", index=False)
+        self._write_artifact("supplementary/table_s2_learning_comparison.csv",
+                             _csv_bytes(_TABLE_S2_COLUMNS, _TABLE_S2_ROWS))
         
         # Table S3: System specifications
-        system_specs = pd.DataFrame({
-            'Component': ['Operating System', 'Total RAM', 'Available Disk Space', 'Processor', 'Architecture', 'Compiler', 'Dependencies'],
-            'Specification': ['Windows 11', '7.84 GB', '11.48 GB', 'Multi-core x64', 'Unified Neural Substrate', 'MSVC C++20', 'OpenCV, Cap\'n Proto, SQLite3'],
-            'Version': ['Build 22000+', 'DDR4', 'SSD', 'Variable', 'v1.0', '2022+', 'Latest stable']
-        })
-        
-        system_specs.to_csv(self.output_dir / "supplementary" / "table_s3_system_specifications.csv", index=False)
+        self._write_artifact("supplementary/table_s3_system_specifications.csv",
+                             _csv_bytes(_TABLE_S3_COLUMNS, _TABLE_S3_ROWS))
     
     def generate_parameter_specifications(self):
         """Generate detailed parameter specifications."""
@@ -364,8 +781,7 @@ class ExperimentalArtifactsGenerator:
             }
         }
         
-        with open(self.output_dir / "supplementary" / "parameter_specifications.json", 'w') as f:
-            json.dump(parameters, f, indent=2)
+        self._write_json("supplementary/parameter_specifications.json", parameters)
     
     def generate_experimental_protocols(self):
         """Generate detailed experimental protocols."""
@@ -435,350 +851,40 @@ class ExperimentalArtifactsGenerator:
             }
         }
         
-        with open(self.output_dir / "supplementary" / "experimental_protocols.json", 'w') as f:
-            json.dump(protocols, f, indent=2)
+        self._write_json("supplementary/experimental_protocols.json", protocols)
     
     def generate_analysis_scripts(self):
         """Generate analysis and reproduction scripts."""
         print("  Generating analysis scripts...")
         
-        # Python analysis script
-        analysis_script = '''#!/usr/bin/env python3
-"""
-NeuroForge Results Analysis Script
-Reproduces key analyses from the paper
-"""
-
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from pathlib import Path
-
-def load_scaling_data():
-    """Load scaling performance data."""
-    return pd.read_csv("datasets/scaling_performance.csv")
-
-def analyze_scaling_performance():
-    """Analyze scaling performance characteristics."""
-    df = load_scaling_data()
-    
-    # Memory scaling analysis
-    memory_slope = np.polyfit(np.log10(df['neuron_count']), np.log10(df['memory_usage_mb']), 1)[0]
-    print(f"Memory scaling exponent: {memory_slope:.3f}")
-    
-    # Processing time analysis
-    time_slope = np.polyfit(np.log10(df['neuron_count']), np.log10(df['processing_time_ms']), 1)[0]
-    print(f"Processing time scaling exponent: {time_slope:.3f}")
-    
-    return df
-
-def analyze_learning_convergence():
-    """Analyze learning mechanism convergence."""
-    df = pd.read_csv("datasets/learning_convergence.csv")
-    
-    # Final performance comparison
-    final_stdp = df['stdp_only_reward'].iloc[-1]
-    final_hebbian = df['hebbian_only_reward'].iloc[-1]
-    final_unified = df['unified_reward'].iloc[-1]
-    
-    print(f"Final STDP performance: {final_stdp:.3f}")
-    print(f"Final Hebbian performance: {final_hebbian:.3f}")
-    print(f"Final unified performance: {final_unified:.3f}")
-    print(f"Improvement over STDP: {(final_unified - final_stdp)/final_stdp*100:.1f}%")
-    print(f"Improvement over Hebbian: {(final_unified - final_hebbian)/final_hebbian*100:.1f}%")
-
-def analyze_assembly_formation():
-    """Analyze neural assembly characteristics."""
-    df = pd.read_csv("datasets/neural_assemblies.csv")
-    
-    # Assembly statistics by scale
-    stats = df.groupby('scale').agg({
-        'size': ['mean', 'std', 'count'],
-        'cohesion_score': ['mean', 'std'],
-        'cross_regional': 'mean'
-    }).round(3)
-    
-    print("Assembly statistics by scale:")
-    print(stats)
-
-if __name__ == "__main__":
-    print("NeuroForge Results Analysis")
-    print("=" * 30)
-    
-    analyze_scaling_performance()
-    print()
-    analyze_learning_convergence()
-    print()
-    analyze_assembly_formation()
-'''
-        
-        with open(self.output_dir / "code" / "analyze_results.py", 'w') as f:
-            f.write(analysis_script)
-        
-        # R analysis script
-        r_script = '''# NeuroForge Statistical Analysis in R
-# Reproduces statistical analyses from the paper
-
-library(ggplot2)
-library(dplyr)
-library(readr)
-
-# Load data
-scaling_data <- read_csv("datasets/scaling_performance.csv")
-learning_data <- read_csv("datasets/learning_convergence.csv")
-assembly_data <- read_csv("datasets/neural_assemblies.csv")
-
-# Scaling analysis
-scaling_model <- lm(log10(memory_usage_mb) ~ log10(neuron_count), data = scaling_data)
-print("Memory scaling model:")
-print(summary(scaling_model))
-
-# Learning convergence analysis
-learning_comparison <- learning_data %>%
-  summarise(
-    stdp_final = last(stdp_only_reward),
-    hebbian_final = last(hebbian_only_reward),
-    unified_final = last(unified_reward)
-  )
-
-print("Learning convergence comparison:")
-print(learning_comparison)
-
-# Assembly formation analysis
-assembly_stats <- assembly_data %>%
-  group_by(scale) %>%
-  summarise(
-    mean_size = mean(size),
-    mean_cohesion = mean(cohesion_score),
-    cross_regional_pct = mean(cross_regional) * 100,
-    .groups = 'drop'
-  )
-
-print("Assembly statistics by scale:")
-print(assembly_stats)
-'''
-        
-        with open(self.output_dir / "code" / "statistical_analysis.R", 'w') as f:
-            f.write(r_script)
+        self._write_artifact("code/analyze_results.py", _ANALYSIS_SCRIPT_PY.encode())
+        self._write_artifact("code/statistical_analysis.R", _STATISTICAL_ANALYSIS_R.encode())
     
     def generate_reproduction_guide(self):
         """Generate reproduction guide."""
         print("  Generating reproduction guide...")
         
-        guide = '''# NeuroForge Reproduction Guide
-
-## Overview
-This guide provides step-by-step instructions for reproducing the experimental results presented in the NeuroForge papers.
-
-## System Requirements
-- Windows 11 (or compatible OS)
-- Minimum 8GB RAM (16GB recommended)
-- 2GB free disk space
-- C++20 compatible compiler
-- Python 3.8+ with required packages
-
-## Installation
-1. Clone the NeuroForge repository
-2. Install dependencies: OpenCV, Cap'n Proto, SQLite3
-3. Build the system using CMake
-4. Verify installation with basic tests
-
-## Reproducing Scaling Experiments
-
-### Basic Scaling Test (64 to 100K neurons)
-```bash
-# Run basic scaling test
-powershell -ExecutionPolicy Bypass -File "scripts\\basic_scaling_test.ps1" -MaxNeurons 100000
-```
-
-### Million Neuron Test
-```bash
-# Run million neuron test (requires significant time and memory)
-powershell -ExecutionPolicy Bypass -File "scripts\\million_neuron_test.ps1"
-```
-
-### Expected Results
-- 100% completion rate across all scales
-- Linear memory scaling (64 bytes per neuron)
-- Predictable processing time scaling
-- Neural assembly formation at larger scales
-
-## Reproducing Learning Experiments
-
-### Learning Mechanism Comparison
-```bash
-# Test individual mechanisms
-.\\build\\Release\\neuroforge.exe --steps=1000 --learning-mode=stdp
-.\\build\\Release\\neuroforge.exe --steps=1000 --learning-mode=hebbian
-.\\build\\Release\\neuroforge.exe --steps=1000 --learning-mode=unified
-```
-
-### Expected Results
-- Unified learning shows superior convergence
-- Optimal distribution: ~75% Hebbian, ~25% STDP
-- Improved stability and performance
-
-## Reproducing Assembly Analysis
-
-### Assembly Detection
-```bash
-# Run with assembly detection enabled
-python scripts\\assembly_detector.py connectivity_data.csv --threshold 0.1
-```
-
-### Expected Results
-- Assembly formation at all scales > 1K neurons
-- Cross-regional integration
-- Stable assembly characteristics
-
-## Data Analysis
-
-### Statistical Analysis
-```bash
-# Run analysis scripts
-python code/analyze_results.py
-Rscript code/statistical_analysis.R
-```
-
-### Visualization
-```bash
-# Generate figures
-python scripts/generate_publication_figures.py
-```
-
-## Troubleshooting
-
-### Common Issues
-1. **Memory limitations**: Reduce neuron count or increase system RAM
-2. **Compilation errors**: Verify C++20 compiler and dependencies
-3. **Performance issues**: Check system resources and background processes
-4. **Assembly detection failures**: Adjust threshold parameters
-
-### Performance Optimization
-- Use Release build configuration
-- Close unnecessary applications
-- Ensure adequate free disk space
-- Monitor system temperature
-
-## Validation Criteria
-
-### Scaling Tests
-- [ ] All tests complete without crashes
-- [ ] Memory usage scales linearly
-- [ ] Processing time scales predictably
-- [ ] Assembly detection functions correctly
-
-### Learning Tests
-- [ ] Convergence achieved within expected timeframe
-- [ ] Learning distribution matches expected ratios
-- [ ] Stability maintained throughout training
-
-### Assembly Tests
-- [ ] Assemblies detected at appropriate scales
-- [ ] Assembly characteristics within expected ranges
-- [ ] Cross-regional integration observed
-
-## Support
-For issues or questions regarding reproduction:
-1. Check system requirements and installation
-2. Verify input data format and parameters
-3. Review troubleshooting section
-4. Contact authors with detailed error information
-
-## Citation
-If you use this code or reproduce these results, please cite:
-[Paper citations will be added upon publication]
-'''
-        
-        with open(self.output_dir / "REPRODUCTION_GUIDE.md", 'w') as f:
-            f.write(guide)
+        self._write_artifact("REPRODUCTION_GUIDE.md", _REPRODUCTION_GUIDE_MD.encode())
     
     def generate_result_summaries(self):
         """Generate result summary files."""
         print("  Generating result summaries...")
         
-        # Main results summary
-        main_results = {
-            'experiment_overview': {
-                'title': 'NeuroForge: Unified Neural Substrate Architecture',
-                'date': '2025-01-28',
-                'duration': '6 months development + 2 months testing',
-                'total_experiments': 156,
-                'successful_experiments': 156,
-                'success_rate': '100%'
-            },
-            'key_achievements': {
-                'maximum_scale': '1,000,000 neurons',
-                'system_stability': '100% across all scales',
-                'memory_efficiency': '64 bytes per neuron',
-                'learning_integration': 'STDP + Hebbian coordination',
-                'assembly_formation': 'Up to 6 assemblies detected',
-                'biological_realism': 'Maintained at all scales'
-            },
-            'performance_highlights': {
-                'linear_memory_scaling': True,
-                'predictable_processing_time': True,
-                'stable_learning_convergence': True,
-                'robust_assembly_detection': True,
-                'cross_regional_integration': True
-            },
-            'technical_innovations': [
-                'Unified neural substrate architecture',
-                'Coordinated STDP-Hebbian learning',
-                'Sparse connectivity optimization',
-                'Real-time assembly detection',
-                'Linear memory scaling algorithms'
-            ],
-            'scientific_contributions': [
-                'First million-neuron biological AI demonstration',
-                'Optimal learning mechanism distribution discovery',
-                'Scalable neural assembly formation validation',
-                'Unified substrate architecture proof-of-concept',
-                'Brain-scale simulation feasibility demonstration'
-            ]
-        }
-        
-        with open(self.output_dir / "results" / "main_results_summary.json", 'w') as f:
-            json.dump(main_results, f, indent=2)
-        
-        # Performance benchmarks
-        benchmarks = {
-            'scaling_benchmarks': {
-                '64_neurons': {'time': '20.4ms/step', 'memory': '4KB', 'assemblies': 0},
-                '1K_neurons': {'time': '20.3ms/step', 'memory': '64KB', 'assemblies': 1},
-                '10K_neurons': {'time': '80.3ms/step', 'memory': '640KB', 'assemblies': 6},
-                '100K_neurons': {'time': '500ms/step', 'memory': '6.4MB', 'assemblies': 6},
-                '1M_neurons': {'time': '3000ms/step', 'memory': '64MB', 'assemblies': 4}
-            },
-            'learning_benchmarks': {
-                'stdp_only': {'convergence': 0.34, 'stability': 0.65, 'time': '15min'},
-                'hebbian_only': {'convergence': 0.36, 'stability': 0.70, 'time': '12min'},
-                'unified': {'convergence': 0.42, 'stability': 0.95, 'time': '8min'}
-            },
-            'assembly_benchmarks': {
-                'formation_rate': '3x higher with coordinated learning',
-                'stability_improvement': '60% better persistence',
-                'coherence_improvement': '45% higher internal connectivity',
-                'cross_regional_percentage': '70% of assemblies span regions'
-            }
-        }
-        
-        with open(self.output_dir / "results" / "performance_benchmarks.json", 'w') as f:
-            json.dump(benchmarks, f, indent=2)
+        self._write_json("results/main_results_summary.json", _MAIN_RESULTS)
+        self._write_json("results/performance_benchmarks.json", _PERFORMANCE_BENCHMARKS)
     
     def create_artifact_archive(self):
         """Create compressed archive of all artifacts."""
         print("  Creating artifact archive...")
         
-        archive_path = self.output_dir / "neuroforge_experimental_artifacts.zip"
+        archive_path = self.output_dir / _ARCHIVE_NAME
         
-        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add all files in the artifacts directory
-            for file_path in self.output_dir.rglob('*'):
-                if file_path.is_file() and file_path != archive_path:
-                    arcname = file_path.relative_to(self.output_dir)
-                    zipf.write(file_path, arcname)
+        # Zip straight from the in-memory copies instead of re-reading the files;
+        # level 1 is plenty for CSV/JSON text
+        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+            # Sorted so the archive layout does not depend on thread scheduling
+            for arcname, data in sorted(self._artifacts):
+                zipf.writestr(arcname, data)
         
         print(f"  Archive created: {archive_path}")
         
@@ -790,48 +896,18 @@ If you use this code or reproduce these results, please cite:
                 'created': datetime.now().isoformat(),
                 'description': 'Complete experimental artifacts for NeuroForge papers'
             },
-            'contents': {
-                'datasets': [
-                    'scaling_performance.csv - Scaling test results',
-                    'learning_convergence.csv - Learning mechanism comparison',
-                    'neural_assemblies.csv - Assembly formation data',
-                    'connectivity_matrix.csv - Network connectivity data'
-                ],
-                'supplementary': [
-                    'table_s1_performance_metrics.csv - Detailed performance table',
-                    'table_s2_learning_comparison.csv - Learning mechanism comparison',
-                    'table_s3_system_specifications.csv - System requirements',
-                    'parameter_specifications.json - All model parameters',
-                    'experimental_protocols.json - Detailed protocols'
-                ],
-                'code': [
-                    'analyze_results.py - Python analysis script',
-                    'statistical_analysis.R - R statistical analysis'
-                ],
-                'results': [
-                    'main_results_summary.json - Key findings summary',
-                    'performance_benchmarks.json - Performance benchmarks'
-                ],
-                'documentation': [
-                    'REPRODUCTION_GUIDE.md - Step-by-step reproduction guide'
-                ]
-            },
-            'usage_instructions': [
-                '1. Extract archive to desired location',
-                '2. Install required dependencies (Python, R, NeuroForge)',
-                '3. Follow REPRODUCTION_GUIDE.md for step-by-step instructions',
-                '4. Run analysis scripts to reproduce key results',
-                '5. Refer to supplementary materials for detailed parameters'
-            ]
+            **_MANIFEST_BODY,
         }
         
-        with open(self.output_dir / "MANIFEST.json", 'w') as f:
-            json.dump(manifest, f, indent=2)
+        self._write_json("MANIFEST.json", manifest)
 
 def main():
     """Generate all experimental artifacts."""
+    parser = argparse.ArgumentParser(description='Generate NeuroForge experimental artifacts')
+    parser.add_argument('--force', action='store_true', help='Regenerate even if the artifacts are up to date')
+    args = parser.parse_args()
     generator = ExperimentalArtifactsGenerator()
-    generator.generate_all_artifacts()
+    generator.generate_all_artifacts(force=args.force)
     print("Experimental artifacts generated successfully!")
 
 if __name__ == '__main__':
@@ -4,6 +4,8 @@ Generate a synthetic hysteresis trajectory for Phase 15 ethics decisions.
 
 Emits a JSON with an `ethics_regulator_log` list where the threshold changes
 mid-run according to the provided segments, e.g. "0.2:1500,0.4:1500,0.3:1500".
+Entries are written compactly, one per line, so the file can also be
+consumed line by line.
 
 Usage (Windows PowerShell):
   python scripts/generate_hysteresis.py --out web/hysteresis_0.2_0.4_0.3.json \
@@ -20,9 +22,16 @@ import argparse
 import json
 import math
 import os
-import random
 import time
-from typing import List, Dict, Tuple
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 def parse_segments(spec: str) -> List[Tuple[float, int]]:
@@ -34,12 +43,22 @@ def parse_segments(spec: str) -> List[Tuple[float, int]]:
     return segs
 
 
-def gen_decision(risk: float, thr: float) -> str:
-    if risk <= thr - 0.05:
-        return "allow"
-    if risk >= thr + 0.05:
-        return "deny"
-    return "review"
+def dumps_line(obj) -> bytes:
+    """Compact single-line JSON for one log entry, via orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def gen_decision(thr: float) -> Callable[[np.ndarray], np.ndarray]:
+    """Element-wise decision rule for threshold thr, with the review band bounds bound once."""
+    lo = thr - 0.05
+    hi = thr + 0.05
+
+    def decide(risk: np.ndarray) -> np.ndarray:
+        return np.where(risk <= lo, "allow", np.where(risk >= hi, "deny", "review"))
+
+    return decide
 
 
 def main():
@@ -50,39 +69,56 @@ def main():
     ap.add_argument("--seed", type=int, default=42)
     args = ap.parse_args()
 
-    random.seed(args.seed)
+    rng = np.random.default_rng(args.seed)
     segments = parse_segments(args.segments)
 
     now_ms = int(time.time() * 1000)
     dt_ms = 2000
     ts = now_ms
-    logs: List[Dict] = []
-
-    for thr, count in segments:
-        for _ in range(count):
-            # Sample risk around threshold with mild noise (Gaussian clipped to [0,1])
-            risk = max(0.0, min(1.0, random.gauss(mu=thr, sigma=0.08)))
-            dec = gen_decision(risk, thr)
-            entry = {
-                "ts_ms": ts,
-                "decision": dec,
-                "risk": round(risk, 3),
-                "notes": "hysteresis segment",
-                "context": {
-                    "coherence": round(random.random(), 3),
-                    "goal_mae": round(random.random() * 0.25, 3),
-                    "window": args.window,
-                    "threshold": thr,
-                },
-            }
-            logs.append(entry)
-            ts += dt_ms
-
-    out = {"ethics_regulator_log": logs}
+    total = 0
+
     os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
-    with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(out, f, indent=2)
-    print(f"Wrote hysteresis log to {args.out} (segments={len(segments)}, total={len(logs)})")
+    with open(args.out, "wb") as f:
+        # Still one JSON document for existing readers, but each entry sits on its
+        # own line and segments are written as they are generated
+        f.write(b'{"ethics_regulator_log": [\n')
+        sep = b""
+        for thr, count in segments:
+            if count <= 0:
+                continue
+            # Sample the whole segment at once: risk around threshold with mild
+            # noise (Gaussian clipped to [0,1]), plus coherence and goal MAE
+            risks = rng.normal(thr, 0.08, count).clip(0.0, 1.0)
+            decide = gen_decision(thr)
+            decisions = decide(risks)
+            ts_arr = ts + np.arange(count, dtype=np.int64) * dt_ms
+            # Milli-quantize risk, coherence and goal MAE together in one batched round
+            risk_q, coherence, goal_mae = np.round(
+                np.stack([risks, rng.random(count), rng.random(count) * 0.25]), 3
+            )
+            lines = [
+                dumps_line({
+                    "ts_ms": t,
+                    "decision": dec,
+                    "risk": risk,
+                    "notes": "hysteresis segment",
+                    "context": {
+                        "coherence": coh,
+                        "goal_mae": mae,
+                        "window": args.window,
+                        "threshold": thr,
+                    },
+                })
+                for t, dec, risk, coh, mae in zip(ts_arr.tolist(), decisions.tolist(), risk_q.tolist(),
+                                                  coherence.tolist(), goal_mae.tolist())
+            ]
+            f.write(sep + b",\n".join(lines))
+            sep = b",\n"
+            ts += count * dt_ms
+            total += count
+        f.write(b"\n]}\n")
+
+    print(f"Wrote hysteresis log to {args.out} (segments={len(segments)}, total={total})")
 
 
 if __name__ == "__main__":
@@ -11,11 +11,32 @@ Example:
 
 import argparse
 import base64
+import codecs
+import fnmatch
 import io
 import json
 import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape as xml_escape
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_loads(data):
+    """Parse JSON from bytes/str, via orjson when available (stdlib also accepts NaN/Infinity)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 def try_imports():
     pd = np = plt = None
@@ -28,23 +49,38 @@ def try_imports():
     except Exception:
         np = None
     try:
+        import matplotlib  # type: ignore
+        matplotlib.use("Agg")  # headless; skip GUI backend probing
         import matplotlib.pyplot as plt  # type: ignore
     except Exception:
         plt = None
     return pd, np, plt
 
-def read_csv_any(path: str, pd) -> Tuple[List[Dict[str, Any]], List[str]]:
+def read_csv_any(path: str, pd) -> Tuple[Any, List[str]]:
+    """Return (table, columns): a DataFrame when pandas is available, else a dict of column lists.
+
+    Either way ``table[col]`` yields one column, so callers index both shapes alike.
+    """
     if pd is not None:
         df = pd.read_csv(path)
-        return df.to_dict(orient="records"), list(df.columns)
-    # fallback
+        return df, list(df.columns)
+    # fallback: plain csv.reader rows (no per-row dict), transposed into columns.
+    # Like csv.DictReader, blank lines are skipped and short rows pad with None; every row is
+    # fitted to the header first so each header name keeps a column of len(rows) cells
     import csv
-    rows: List[Dict[str, Any]] = []
     with open(path, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            rows.append(r)
-        return rows, reader.fieldnames or []
+        reader = csv.reader(f)
+        header = next(reader, [])
+        width = len(header)
+        pad = (None,) * width
+        rows = [tuple(row[:width]) + pad[len(row):] for row in reader if row]
+    columns = list(zip(*rows)) if rows else [()] * width
+    return dict(zip(header, columns)), header
+
+def row_count(table: Any) -> int:
+    if isinstance(table, dict):
+        return len(next(iter(table.values()), ()))
+    return len(table)
 
 def to_float_safe(v: Any) -> Optional[float]:
     try:
@@ -65,12 +101,72 @@ def find_col(cands: List[str], cols: List[str]) -> Optional[str]:
             return c
     return None
 
-def slope_linear(xs: List[float], ys: List[float], np_mod) -> Optional[float]:
+def welford(values: Iterable[Optional[float]]) -> Tuple[int, float, float]:
+    """Single-pass running (count, mean, M2) over values; None entries are skipped."""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in values:
+        if x is None:
+            continue
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return n, mean, m2
+
+def mean_std(values: Iterable[Optional[float]]) -> Tuple[Optional[float], Optional[float]]:
+    n, mean, m2 = welford(values)
+    if n == 0:
+        return None, None
+    std = round((m2 / (n - 1)) ** 0.5, 3) if n > 1 else None
+    return round(mean, 3), std
+
+def numeric_values(table: Any, col: Optional[str], pd) -> Any:
+    """Numeric values of col with blank/unparseable entries dropped (ndarray for DataFrames, else list)."""
+    if col is None:
+        return []
+    if pd is not None and isinstance(table, pd.DataFrame):
+        return pd.to_numeric(table[col], errors="coerce").dropna().to_numpy(dtype=float)
+    vals = [to_float_safe(v) for v in table[col]]
+    return [v for v in vals if v is not None]
+
+def numeric_pairs(table: Any, xcol: Optional[str], ycol: Optional[str], pd) -> Tuple[Any, Any]:
+    """Aligned numeric (x, y) values of two columns, dropping rows where either is missing."""
+    if xcol is None or ycol is None:
+        return [], []
+    if pd is not None and isinstance(table, pd.DataFrame):
+        df = table[[xcol, ycol]].apply(pd.to_numeric, errors="coerce").dropna()
+        return df[xcol].to_numpy(dtype=float), df[ycol].to_numpy(dtype=float)
+    xs: List[float] = []
+    ys: List[float] = []
+    for xv, yv in zip(table[xcol], table[ycol]):
+        x = to_float_safe(xv)
+        y = to_float_safe(yv)
+        if x is not None and y is not None:
+            xs.append(x)
+            ys.append(y)
+    return xs, ys
+
+def column_mean_std(table: Any, col: Optional[str], pd) -> Tuple[Optional[float], Optional[float]]:
+    if col is None:
+        return None, None
+    if pd is not None and isinstance(table, pd.DataFrame):
+        s = pd.to_numeric(table[col], errors="coerce").dropna()
+        if s.empty:
+            return None, None
+        std = round(float(s.std()), 3) if len(s) > 1 else None
+        return round(float(s.mean()), 3), std
+    return mean_std(to_float_safe(v) for v in table[col])
+
+def slope_linear(xs: Sequence[float], ys: Sequence[float], np_mod) -> Optional[float]:
     if len(xs) < 2 or len(xs) != len(ys):
         return None
     try:
         if np_mod is not None:
-            m, b = np_mod.polyfit(xs, ys, 1)
+            x = np_mod.asarray(xs, dtype=np_mod.float64)
+            y = np_mod.asarray(ys, dtype=np_mod.float64)
+            m, b = np_mod.polyfit(x, y, 1)
             return float(m)
         # fallback simple slope
         x_mean = sum(xs) / len(xs)
@@ -83,26 +179,167 @@ def slope_linear(xs: List[float], ys: List[float], np_mod) -> Optional[float]:
     except Exception:
         return None
 
-def encode_plot_png(plt_mod, xs: List[float], ys: List[float], title: str, xlabel: str, ylabel: str) -> Optional[str]:
-    if plt_mod is None or len(xs) == 0 or len(ys) == 0:
+def read_integrity(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
+    except Exception:
+        return {"error": f"Failed to read {path}"}
+
+def median_delta(values: Sequence[float], np_mod) -> Optional[float]:
+    """Median spacing between consecutive values (used to estimate sampling intervals)."""
+    if len(values) < 2:
         return None
-    fig, ax = plt_mod.subplots(figsize=(4, 2.5), dpi=120)
-    ax.plot(xs, ys, linewidth=1.5)
-    ax.set_title(title)
-    ax.set_xlabel(xlabel)
-    ax.set_ylabel(ylabel)
-    ax.grid(True, alpha=0.3)
-    buf = io.BytesIO()
-    fig.tight_layout()
-    fig.savefig(buf, format='png')
-    plt_mod.close(fig)
-    data = base64.b64encode(buf.getvalue()).decode('ascii')
-    return f"<img alt='{title}' src='data:image/png;base64,{data}' />"
+    if np_mod is not None:
+        return float(np_mod.median(np_mod.diff(np_mod.asarray(values, dtype=np_mod.float64))))
+    deltas = sorted(values[i]-values[i-1] for i in range(1, len(values)))
+    n = len(deltas)
+    m = n//2
+    return deltas[m] if n % 2 == 1 else (deltas[m-1]+deltas[m])/2.0
+
+def _sniff_encoding(data: bytes) -> str:
+    """Pick a codec from the BOM (or NUL layout for BOM-less UTF-16) instead of trial decoding."""
+    if data.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if data.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+        return 'utf-32'
+    if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    # JSON starts with an ASCII character, so BOM-less UTF-16 shows a NUL in the first two bytes
+    if data[:1] == b'\x00':
+        return 'utf-16-be'
+    if data[1:2] == b'\x00':
+        return 'utf-16-le'
+    return 'utf-8'
+
+# Robust JSON loader to handle UTF-8 BOM and common Windows encodings.
+def _load_json_any_encoding(path: str):
+    try:
+        with open(path, 'rb') as fb:
+            data = fb.read()
+    except Exception:
+        return {}
+    enc = _sniff_encoding(data)
+    try:
+        # Plain UTF-8 goes to the parser as bytes; other codecs need a decode first
+        return _json_loads(data if enc == 'utf-8' else data.decode(enc))
+    except Exception:
+        pass
+    try:
+        return json.loads(data.decode('utf-8', errors='ignore'))
+    except Exception:
+        return {}
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+def png_from_rgba(width: int, height: int, rgba: bytes) -> bytes:
+    """Minimal 8-bit RGBA PNG (filter type 0 on every row, default zlib level)."""
+    stride = width * 4
+    raw = b"".join(b"\x00" + rgba[y * stride:(y + 1) * stride] for y in range(height))
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", ihdr)
+            + _png_chunk(b"IDAT", zlib.compress(raw)) + _png_chunk(b"IEND", b""))
+
+def encode_plot_svg(xs: Sequence[float], ys: Sequence[float], title: str, xlabel: str, ylabel: str,
+                    width: int = 480, height: int = 300) -> Optional[str]:
+    """Lean inline SVG line plot (frame, min/max ticks, labels, one polyline); no matplotlib needed."""
+    if len(xs) == 0 or len(ys) == 0:
+        return None
+    x0, x1 = float(min(xs)), float(max(xs))
+    y0, y1 = float(min(ys)), float(max(ys))
+    left, right, top, bottom = 50, 12, 26, 34
+    pw, ph = width - left - right, height - top - bottom
+    kx = pw / ((x1 - x0) or 1.0)
+    ky = ph / ((y1 - y0) or 1.0)
+    # A line can show at most a couple of points per pixel column; keep each column's
+    # min and max (in x order) so spikes survive and the payload stays small
+    buckets: Dict[int, List[Tuple[float, float]]] = {}
+    for x, y in zip(xs, ys):
+        col = int((x - x0) * kx)
+        b = buckets.get(col)
+        if b is None:
+            buckets[col] = [(x, y), (x, y)]
+        else:
+            if y < b[0][1]:
+                b[0] = (x, y)
+            if y > b[1][1]:
+                b[1] = (x, y)
+    keep = [p for col in sorted(buckets) for p in sorted(set(buckets[col]))]
+    pts = " ".join(f"{left + (x - x0) * kx:.1f},{top + ph - (y - y0) * ky:.1f}" for x, y in keep)
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" font-family="sans-serif" font-size="10">'
+        f'<rect width="{width}" height="{height}" fill="#fff"/>'
+        f'<rect x="{left}" y="{top}" width="{pw}" height="{ph}" fill="none" stroke="#888"/>'
+        f'<polyline points="{pts}" fill="none" stroke="#1f77b4" stroke-width="1.2"/>'
+        f'<text x="{width / 2:g}" y="16" text-anchor="middle" font-size="12">{xml_escape(title)}</text>'
+        f'<text x="{left + pw / 2:g}" y="{height - 4}" text-anchor="middle">{xml_escape(xlabel)}</text>'
+        f'<text transform="translate(12,{top + ph / 2:g}) rotate(-90)" text-anchor="middle">{xml_escape(ylabel)}</text>'
+        f'<text x="{left - 3}" y="{top + ph}" text-anchor="end">{y0:g}</text>'
+        f'<text x="{left - 3}" y="{top + 8}" text-anchor="end">{y1:g}</text>'
+        f'<text x="{left}" y="{top + ph + 12}">{x0:g}</text>'
+        f'<text x="{left + pw}" y="{top + ph + 12}" text-anchor="end">{x1:g}</text>'
+        '</svg>'
+    )
+    data = base64.b64encode(svg.encode('utf-8')).decode('ascii')
+    return f"<img alt='{title}' src='data:image/svg+xml;base64,{data}' />"
+
+# (fig, ax) for the report plots; the setup is static, so it is built once per process
+# and shared by every report generated in it (e.g. from a batch driver calling main())
+_FIG = None
+
+_DEFAULT_MARGINS: Dict[str, float] = {}
+
+def _get_fig(plt_mod):
+    global _FIG
+    if _FIG is None:
+        _FIG = plt_mod.subplots(figsize=(4, 2.5), dpi=120)
+        pars = _FIG[0].subplotpars
+        _DEFAULT_MARGINS.update(left=pars.left, right=pars.right, bottom=pars.bottom, top=pars.top)
+    return _FIG
+
+class PlotEncoder:
+    """Renders small line plots as inline base64 PNG <img> tags on the shared Figure."""
+
+    def __init__(self, plt_mod):
+        self.fig = self.ax = None
+        if plt_mod is not None:
+            self.fig, self.ax = _get_fig(plt_mod)
+        self.buf = io.BytesIO()
+
+    def encode(self, xs: Sequence[float], ys: Sequence[float], title: str, xlabel: str, ylabel: str) -> Optional[str]:
+        if self.fig is None or len(xs) == 0 or len(ys) == 0:
+            return None
+        ax = self.ax
+        ax.cla()
+        # Start tight_layout from the default margins, not the previous plot's
+        self.fig.subplots_adjust(**_DEFAULT_MARGINS)
+        ax.plot(xs, ys, linewidth=1.5)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.grid(True, alpha=0.3)
+        self.fig.tight_layout()
+        try:
+            # Render once and wrap the Agg RGBA buffer ourselves; cheaper than savefig's encoder
+            canvas = self.fig.canvas
+            canvas.draw()
+            width, height = canvas.get_width_height(physical=True)
+            png = png_from_rgba(width, height, bytes(canvas.buffer_rgba()))
+        except Exception:
+            self.buf.seek(0)
+            self.buf.truncate(0)
+            self.fig.savefig(self.buf, format='png')
+            png = self.buf.getvalue()
+        data = base64.b64encode(png).decode('ascii')
+        return f"<img alt='{title}' src='data:image/png;base64,{data}' />"
 
 def main():
     parser = argparse.ArgumentParser(description="Generate NeuroForge production Markdown report")
     parser.add_argument("--exports", required=True, help="Exports directory containing CSVs and integrity_report.json")
     parser.add_argument("--out", required=True, help="Output Markdown path")
+    parser.add_argument("--plot-format", choices=["png", "svg"], default="png",
+                        help="Inline plot format; svg is much smaller and does not need matplotlib")
     args = parser.parse_args()
 
     exports_dir = args.exports
@@ -111,116 +348,75 @@ def main():
 
     pd, np_mod, plt_mod = try_imports()
 
-    import glob
     def pick_csv(bases: List[str]) -> Optional[str]:
-        candidates: List[str] = []
-        for pat in bases:
-            candidates.extend(glob.glob(os.path.join(exports_dir, pat)))
+        """Newest file in exports_dir matching any of the patterns (one directory scan)."""
+        try:
+            with os.scandir(exports_dir) as it:
+                candidates = [e for e in it if e.is_file() and any(fnmatch.fnmatch(e.name, pat) for pat in bases)]
+        except OSError:
+            return None
         if not candidates:
             return None
         try:
-            candidates.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-        except Exception:
-            pass
-        return candidates[0]
+            return max(candidates, key=lambda e: e.stat().st_mtime).path
+        except OSError:
+            return candidates[0].path
 
     ls_path = pick_csv(["learning_stats.csv", "learning_stats_run_*.csv"]) or os.path.join(exports_dir, "learning_stats.csv")
     rw_path = pick_csv(["reward_log.csv", "reward_log_run_*.csv"]) or os.path.join(exports_dir, "reward_log.csv")
     ir_path = os.path.join(exports_dir, "integrity_report.json")
 
-    learning_rows: List[Dict[str, Any]] = []
+    learning_rows: Any = []
     learning_cols: List[str] = []
-    reward_rows: List[Dict[str, Any]] = []
+    reward_rows: Any = []
     reward_cols: List[str] = []
     integrity: Dict[str, Any] = {}
+    meta: Any = {}
 
-    if ls_path and os.path.exists(ls_path):
-        learning_rows, learning_cols = read_csv_any(ls_path, pd)
-    if rw_path and os.path.exists(rw_path):
-        reward_rows, reward_cols = read_csv_any(rw_path, pd)
-    if os.path.exists(ir_path):
-        try:
-            with open(ir_path, 'r', encoding='utf-8') as f:
-                integrity = json.load(f)
-        except Exception:
-            integrity = {"error": f"Failed to read {ir_path}"}
+    meta_path = None
+    for name in ("run_meta.json", "production_meta.json"):
+        candidate = os.path.join(exports_dir, name)
+        if os.path.exists(candidate):
+            meta_path = candidate
+            break
+
+    # The inputs are independent files; read them concurrently (file I/O releases the GIL)
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        ls_fut = ex.submit(read_csv_any, ls_path, pd) if ls_path and os.path.exists(ls_path) else None
+        rw_fut = ex.submit(read_csv_any, rw_path, pd) if rw_path and os.path.exists(rw_path) else None
+        ir_fut = ex.submit(read_integrity, ir_path) if os.path.exists(ir_path) else None
+        meta_fut = ex.submit(_load_json_any_encoding, meta_path) if meta_path else None
+        if ls_fut is not None:
+            learning_rows, learning_cols = ls_fut.result()
+        if rw_fut is not None:
+            reward_rows, reward_cols = rw_fut.result()
+        if ir_fut is not None:
+            integrity = ir_fut.result()
+        if meta_fut is not None:
+            meta = meta_fut.result()
 
     # Extract stats from learning_stats
     hz_col = find_col(["processing_hz", "hz", "proc_hz"], learning_cols)
     upd_col = find_col(["updates", "update_count"], learning_cols)
     ts_col_ls = find_col(["timestamp_ms", "ts_ms", "ts", "time_ms", "time"], learning_cols)
-    ls_hz = [to_float_safe(r.get(hz_col)) for r in learning_rows] if hz_col else []
-    ls_hz = [v for v in ls_hz if v is not None]
-    ls_upd = [to_float_safe(r.get(upd_col)) for r in learning_rows] if upd_col else []
-    ls_upd = [v for v in ls_upd if v is not None]
-    ls_ts = [to_float_safe(r.get(ts_col_ls)) for r in learning_rows] if ts_col_ls else []
-    ls_ts = [v for v in ls_ts if v is not None]
-
-    hz_mean = round(sum(ls_hz)/len(ls_hz), 3) if ls_hz else None
-    hz_std = None
-    if ls_hz and len(ls_hz) > 1:
-        m = sum(ls_hz)/len(ls_hz)
-        var = sum((x-m)**2 for x in ls_hz)/(len(ls_hz)-1)
-        hz_std = round(var**0.5, 3)
-
-    upd_mean = round(sum(ls_upd)/len(ls_upd), 3) if ls_upd else None
-    upd_std = None
-    if ls_upd and len(ls_upd) > 1:
-        m = sum(ls_upd)/len(ls_upd)
-        var = sum((x-m)**2 for x in ls_upd)/(len(ls_upd)-1)
-        upd_std = round(var**0.5, 3)
+    ls_ts = numeric_values(learning_rows, ts_col_ls, pd)
+    hz_ts, ls_hz = numeric_pairs(learning_rows, ts_col_ls, hz_col, pd)
+
+    hz_mean, hz_std = column_mean_std(learning_rows, hz_col, pd)
+    upd_mean, upd_std = column_mean_std(learning_rows, upd_col, pd)
 
     # Reward slope
     ts_col_rw = find_col(["timestamp_ms", "ts_ms", "ts", "time_ms", "time"], reward_cols)
     reward_col = find_col(["reward", "reward_value", "r"], reward_cols)
-    rw_ts = [to_float_safe(r.get(ts_col_rw)) for r in reward_rows] if ts_col_rw else []
-    rw_ts = [v for v in rw_ts if v is not None]
-    rw_vals = [to_float_safe(r.get(reward_col)) for r in reward_rows] if reward_col else []
-    rw_vals = [v for v in rw_vals if v is not None]
-    rw_slope = slope_linear(rw_ts, rw_vals, np_mod) if rw_ts and rw_vals else None
-
-    # Estimated intervals
-    def median_delta(values: List[float]) -> Optional[float]:
-        if len(values) < 2:
-            return None
-        deltas = sorted(values[i]-values[i-1] for i in range(1, len(values)))
-        n = len(deltas)
-        m = n//2
-        return deltas[m] if n % 2 == 1 else (deltas[m-1]+deltas[m])/2.0
+    rw_ts, rw_vals = numeric_pairs(reward_rows, ts_col_rw, reward_col, pd)
+    rw_slope = slope_linear(rw_ts, rw_vals, np_mod) if len(rw_ts) else None
 
     # Prefer explicit run meta when available; integrity can be noisy for short runs
     memdb_interval_ms = None
     reward_interval_ms = None
     steps = None
 
-    meta_path = None
-    for name in ("run_meta.json", "production_meta.json"):
-        candidate = os.path.join(exports_dir, name)
-        if os.path.exists(candidate):
-            meta_path = candidate
-            break
-    # Robust JSON loader to handle UTF-8 BOM and common Windows encodings
-    def _load_json_any_encoding(path: str):
-        encodings = ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le', 'utf-16-be')
-        for enc in encodings:
-            try:
-                with open(path, 'r', encoding=enc) as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        try:
-            with open(path, 'rb') as fb:
-                data = fb.read()
-            try:
-                return json.loads(data.decode('utf-8-sig'))
-            except Exception:
-                return json.loads(data.decode('utf-8', errors='ignore'))
-        except Exception:
-            return {}
-
-    meta = {}
     if meta_path:
-        meta = _load_json_any_encoding(meta_path)
         # Aliases — always take explicit meta if present
         def read_meta_float(keys: List[str]) -> Optional[float]:
             for k in keys:
@@ -252,93 +448,94 @@ def main():
         reward_interval_ms = float(integrity.get("reward_interval_ms"))
     if steps is None and isinstance(integrity.get("steps"), (int, float)):
         steps = int(integrity.get("steps"))
-    if memdb_interval_ms is None and ls_ts:
-        memdb_interval_ms = median_delta(ls_ts)
-    if reward_interval_ms is None and rw_ts:
-        reward_interval_ms = median_delta(rw_ts)
+    if memdb_interval_ms is None and len(ls_ts):
+        memdb_interval_ms = median_delta(ls_ts, np_mod)
+    if reward_interval_ms is None and len(rw_ts):
+        reward_interval_ms = median_delta(rw_ts, np_mod)
 
-    if steps is None and learning_rows:
+    if steps is None and row_count(learning_rows):
         step_col = find_col(["step", "steps"], learning_cols)
         if step_col:
             try:
-                steps = int(max(int(r.get(step_col)) for r in learning_rows if r.get(step_col) is not None))
+                steps = int(max(numeric_values(learning_rows, step_col, pd)))
             except Exception:
                 steps = None
 
     # Plots
-    reward_img = encode_plot_png(plt_mod, rw_ts, rw_vals, "Reward over time", "timestamp", "reward") if rw_ts and rw_vals else None
-    hz_img = encode_plot_png(plt_mod, ls_ts, ls_hz, "Processing Hz over time", "timestamp", "Hz") if ls_ts and ls_hz else None
-
-    # Markdown render
-    now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-    lines: List[str] = []
-    lines.append(f"# NeuroForge Production Run Report — {datetime.utcnow().strftime('%Y-%m-%d')}")
-    lines.append(f"- Exports dir: {exports_dir}")
-    lines.append(f"- Generated at: {now}")
-    lines.append(f"- Telemetry interval: {memdb_interval_ms if memdb_interval_ms is not None else 'unknown'} ms")
-    lines.append(f"- Reward interval: {reward_interval_ms if reward_interval_ms is not None else 'unknown'} ms")
-    lines.append(f"- Steps: {steps if steps is not None else 'unknown'}")
-
-    # Context configuration summary (Phase 17a/17b)
-    if meta_path:
-        meta = _load_json_any_encoding(meta_path)
-        if isinstance(meta, dict):
-            ctx_meta = meta.get("context", {}) if isinstance(meta.get("context", {}), dict) else {}
-            peers = ctx_meta.get("peers", []) if isinstance(ctx_meta.get("peers", []), list) else []
-            gain = ctx_meta.get("gain")
-            kappa = ctx_meta.get("kappa")
-            c_enabled = ctx_meta.get("couplings_enabled")
-            couplings = ctx_meta.get("couplings", []) if isinstance(ctx_meta.get("couplings", []), list) else []
-            if peers or gain is not None:
-                lines.append("")
-                lines.append("## Context Configuration")
-                lines.append(f"- Context peers: {', '.join(peers) if peers else 'none'}")
-                lines.append(f"- Context gain: {gain if gain is not None else 'n/a'}")
-                if kappa is not None:
-                    lines.append(f"- Context kappa: {kappa}")
-                lines.append(f"- Couplings enabled: {('yes' if c_enabled else 'no') if c_enabled is not None else 'unknown'}")
-                if couplings:
-                    lines.append(f"- Couplings count: {len(couplings)}")
-                    # Show a compact preview of up to 6 couplings
-                    preview = []
-                    for i, c in enumerate(couplings[:6]):
-                        try:
-                            preview.append(f"{c.get('src','?')}→{c.get('dst','?')}:{c.get('lambda','?')}")
-                        except Exception:
-                            pass
-                    if preview:
-                        lines.append(f"- Couplings preview: {', '.join(preview)}")
-
-    if integrity:
-        passed = integrity.get("passed")
-        exp_rows = integrity.get("expected_learning_rows")
-        actual_rows = len(learning_rows)
-        status = "✅ passed" if passed else "⚠️ failed"
-        lines.append(f"- Integrity: {status} (expected {exp_rows}, found {actual_rows})")
-
-    lines.append("\n## Learning Stats")
-    lines.append("| Metric | Mean | Std |")
-    lines.append("|---------|------|-----|")
-    lines.append(f"| processing_hz | {hz_mean if hz_mean is not None else 'n/a'} | {hz_std if hz_std is not None else 'n/a'} |")
-    lines.append(f"| updates | {upd_mean if upd_mean is not None else 'n/a'} | {upd_std if upd_std is not None else 'n/a'} |")
-
-    lines.append("\n## Reward Dynamics")
-    lines.append(f"- Reward slope: {round(rw_slope, 5) if rw_slope is not None else 'n/a'}")
-    if reward_img is not None:
-        lines.append("")
-        lines.append(reward_img)
-    else:
-        lines.append("(Plot unavailable — matplotlib not installed or missing data)")
-
-    lines.append("\n## Processing Hz Trend")
-    if hz_img is not None:
-        lines.append("")
-        lines.append(hz_img)
-    else:
-        lines.append("(Plot unavailable — matplotlib not installed or missing data)")
-
-    with open(out_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines))
+    encode = encode_plot_svg if args.plot_format == "svg" else PlotEncoder(plt_mod).encode
+    reward_img = encode(rw_ts, rw_vals, "Reward over time", "timestamp", "reward") if len(rw_ts) else None
+    hz_img = encode(hz_ts, ls_hz, "Processing Hz over time", "timestamp", "Hz") if len(hz_ts) else None
+
+    # Markdown render, streamed straight to the output file
+    with open(out_path, 'w', encoding='utf-8') as out:
+        def w(line: str) -> None:
+            out.write(line + "\n")
+
+        now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+        w(f"# NeuroForge Production Run Report — {datetime.utcnow().strftime('%Y-%m-%d')}")
+        w(f"- Exports dir: {exports_dir}")
+        w(f"- Generated at: {now}")
+        w(f"- Telemetry interval: {memdb_interval_ms if memdb_interval_ms is not None else 'unknown'} ms")
+        w(f"- Reward interval: {reward_interval_ms if reward_interval_ms is not None else 'unknown'} ms")
+        w(f"- Steps: {steps if steps is not None else 'unknown'}")
+
+        # Context configuration summary (Phase 17a/17b)
+        if meta_path:
+            if isinstance(meta, dict):
+                ctx_meta = meta.get("context", {}) if isinstance(meta.get("context", {}), dict) else {}
+                peers = ctx_meta.get("peers", []) if isinstance(ctx_meta.get("peers", []), list) else []
+                gain = ctx_meta.get("gain")
+                kappa = ctx_meta.get("kappa")
+                c_enabled = ctx_meta.get("couplings_enabled")
+                couplings = ctx_meta.get("couplings", []) if isinstance(ctx_meta.get("couplings", []), list) else []
+                if peers or gain is not None:
+                    w("")
+                    w("## Context Configuration")
+                    w(f"- Context peers: {', '.join(peers) if peers else 'none'}")
+                    w(f"- Context gain: {gain if gain is not None else 'n/a'}")
+                    if kappa is not None:
+                        w(f"- Context kappa: {kappa}")
+                    w(f"- Couplings enabled: {('yes' if c_enabled else 'no') if c_enabled is not None else 'unknown'}")
+                    if couplings:
+                        w(f"- Couplings count: {len(couplings)}")
+                        # Show a compact preview of up to 6 couplings
+                        preview = []
+                        for i, c in enumerate(couplings[:6]):
+                            try:
+                                preview.append(f"{c.get('src','?')}→{c.get('dst','?')}:{c.get('lambda','?')}")
+                            except Exception:
+                                pass
+                        if preview:
+                            w(f"- Couplings preview: {', '.join(preview)}")
+
+        if integrity:
+            passed = integrity.get("passed")
+            exp_rows = integrity.get("expected_learning_rows")
+            actual_rows = row_count(learning_rows)
+            status = "✅ passed" if passed else "⚠️ failed"
+            w(f"- Integrity: {status} (expected {exp_rows}, found {actual_rows})")
+
+        w("\n## Learning Stats")
+        w("| Metric | Mean | Std |")
+        w("|---------|------|-----|")
+        w(f"| processing_hz | {hz_mean if hz_mean is not None else 'n/a'} | {hz_std if hz_std is not None else 'n/a'} |")
+        w(f"| updates | {upd_mean if upd_mean is not None else 'n/a'} | {upd_std if upd_std is not None else 'n/a'} |")
+
+        w("\n## Reward Dynamics")
+        w(f"- Reward slope: {round(rw_slope, 5) if rw_slope is not None else 'n/a'}")
+        if reward_img is not None:
+            w("")
+            w(reward_img)
+        else:
+            w("(Plot unavailable — matplotlib not installed or missing data)")
+
+        w("\n## Processing Hz Trend")
+        if hz_img is not None:
+            w("")
+            w(hz_img)
+        else:
+            w("(Plot unavailable — matplotlib not installed or missing data)")
+
     print(f"Production report written: {out_path}")
 
 if __name__ == "__main__":
@@ -4,20 +4,139 @@ NeuroForge Publication Figure Generator
 Generates all figures, graphs, and visualizations for academic papers
 """
 
+from __future__ import annotations
+
+import matplotlib
+matplotlib.use('Agg')  # file output only; skip GUI backend/toolkit setup
+matplotlib.rcParams.update({
+    'interactive': False,
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
-import pandas as pd
+from cycler import cycler
 from pathlib import Path
-import json
-from typing import Dict, List, Tuple
+import functools
+import os
+from itertools import combinations, repeat
+import matplotlib.image as mpimg
 import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch
-import networkx as nx
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.patches import FancyArrowPatch, FancyBboxPatch
+
+# Publication-quality style: the seaborn-v0_8-whitegrid rc values plus seaborn's
+# 6-colour "husl" palette, applied directly so seaborn need not be imported
+_PUB_RC = {
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.facecolor': 'white',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'axes.linewidth': 1.0,
+    'axes.prop_cycle': cycler(color=['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']),
+    'figure.facecolor': 'white',
+    'font.family': ['sans-serif'],
+    'font.sans-serif': ['Arial', 'Liberation Sans', 'DejaVu Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'grid.color': '.8',
+    'grid.linestyle': '-',
+    'image.cmap': 'Greys',
+    'legend.frameon': False,
+    'legend.numpoints': 1,
+    'legend.scatterpoints': 1,
+    'lines.solid_capstyle': 'round',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'xtick.direction': 'out',
+    'xtick.major.size': 0.0,
+    'xtick.minor.size': 0.0,
+    'ytick.color': '.15',
+    'ytick.direction': 'out',
+    'ytick.major.size': 0.0,
+    'ytick.minor.size': 0.0,
+}
+matplotlib.rcParams.update(_PUB_RC)
+
+# Figure methods run by generate_all_figures, in publication order
+_FIGURE_METHODS = (
+    # Architecture figures
+    'generate_architecture_overview',
+    'generate_unified_vs_distributed',
+    'generate_memory_system_architecture',
+    # Performance figures
+    'generate_scaling_performance',
+    'generate_learning_convergence',
+    'generate_assembly_formation',
+    # Experimental results
+    'generate_million_neuron_results',
+    'generate_comparative_analysis',
+    'generate_biological_realism',
+    # Technical diagrams
+    'generate_system_flow',
+    'generate_neural_assembly_diagram',
+)
+
+@functools.lru_cache(maxsize=None)
+def _learning_curves(seed: int = 42) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Simulated (steps, STDP, Hebbian, unified) learning curves; pure, so cached per seed."""
+    rng = np.random.default_rng(seed)
+    steps = np.arange(0, 1000, 10)
+    stdp_curve = -0.36 * np.expm1(-steps/200) + rng.normal(0, 0.02, len(steps))
+    hebbian_curve = -0.34 * np.expm1(-steps/150) + rng.normal(0, 0.015, len(steps))
+    combined_curve = 0.75 * hebbian_curve + 0.25 * stdp_curve
+    return steps, stdp_curve, hebbian_curve, combined_curve
+
+@functools.lru_cache(maxsize=None)
+def _assembly_timeline(seed: int = 42) -> tuple[np.ndarray, np.ndarray]:
+    """Simulated (time_steps, cumulative assemblies formed); pure, so cached per seed."""
+    rng = np.random.default_rng(seed)
+    time_steps = np.arange(0, 100, 5)
+    return time_steps, np.cumsum(rng.poisson(0.3, len(time_steps)))
+
+@functools.lru_cache(maxsize=None)
+def _binding_curve() -> tuple[np.ndarray, np.ndarray]:
+    """Deterministic (time, binding strength) curve for the assembly diagram."""
+    time = np.linspace(0, 100, 50)
+    return time, np.sin(time/5) * 0.1 - np.expm1(-time/30)
+
+# Scaling benchmark results (neurons -> steps/sec, memory MB), with the 64 B/neuron reference
+_NEURON_COUNTS = np.array([64, 1000, 5000, 10000, 25000, 50000, 100000, 500000, 1000000], dtype=np.int64)
+_STEPS_PER_SEC = np.array([49.0, 49.2, 24.7, 12.5, 10.0, 5.0, 2.0, 0.5, 0.33])
+_MEMORY_MB = np.array([0.004, 0.064, 0.32, 0.64, 1.6, 3.2, 6.4, 32, 64])
+_LINEAR_REF_MB = _NEURON_COUNTS * 64e-6
+
+# Fixed assembly statistics, binned once at import and drawn with ax.stairs
+_ASSEMBLY_SIZES = [3, 5, 7, 12, 8, 15, 6, 9, 11, 4, 18, 7, 13, 6, 10]
+_COHESION_SCORES = [1.2, 2.1, 1.8, 3.2, 1.5, 2.8, 1.9, 2.3, 2.7, 1.6, 3.1, 2.0, 2.5, 1.7, 2.4]
+_ASSEMBLY_SIZE_HIST = np.histogram(_ASSEMBLY_SIZES, bins=8)
+_COHESION_HIST = np.histogram(_COHESION_SCORES, bins=8)
 
-# Set publication-quality style
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
+@functools.lru_cache(maxsize=32)
+def _boxstyle(spec: str) -> patches.BoxStyle:
+    """Parse a box style spec once; identical specs share one (immutable) BoxStyle."""
+    return patches.BoxStyle(spec)
+
+def _add_arrows(ax, segments, **style) -> None:
+    """Draw (start, end) arrows as bare FancyArrowPatches.
+
+    Same look and stacking as ax.annotate('', ...) but without the empty Text
+    artist each annotation carries through layout and drawing.
+    """
+    for start, end in segments:
+        ax.add_patch(FancyArrowPatch(start, end, mutation_scale=plt.rcParams['font.size'], zorder=3, **style))
+
+def _stairs_hist(ax, hist: tuple[np.ndarray, np.ndarray], color: str) -> None:
+    """Draw precomputed (counts, edges) as one filled step patch plus one set of bin dividers."""
+    counts, edges = hist
+    lw = plt.rcParams['patch.linewidth']  # stairs(fill=True) defaults to lw=0
+    ax.stairs(counts, edges, fill=True, facecolor=color, edgecolor='black', linewidth=lw, alpha=0.7)
+    ax.vlines(edges[1:-1], 0, np.minimum(counts[:-1], counts[1:]), colors='black', linewidth=lw, alpha=0.7)
+
+def _render_figure(output_dir: str, method: str) -> str:
+    """Process-pool entry point: render one figure with a fresh generator."""
+    getattr(PublicationFigureGenerator(output_dir), method)()
+    return method
 
 class PublicationFigureGenerator:
     """Generates publication-quality figures for NeuroForge papers."""
@@ -41,35 +160,67 @@ class PublicationFigureGenerator:
             'assembly': '#FF9800',
             'learning': '#9C27B0'
         }
+        
+        # One reusable Figure per (rows, cols, figsize, dpi); methods clf() it when done
+        self._fig_cache: dict[tuple, plt.Figure] = {}
+    
+    def _get_fig(self, rows: int = 1, cols: int = 1, figsize: tuple[float, float] | None = None):
+        """Return (fig, axes) like plt.subplots, recycling the cached Figure for this geometry."""
+        figsize = figsize or (self.fig_width, self.fig_height)
+        key = (rows, cols, figsize, self.dpi)
+        fig = self._fig_cache.get(key)
+        if fig is None:
+            fig = self._fig_cache[key] = plt.figure(figsize=figsize, dpi=self.dpi)
+        return fig, fig.subplots(rows, cols)
+    
+    def _save_both(self, fig, stem: str):
+        """Write <stem>.pdf and <stem>.png, both cropped to the tight bounding box.
+
+        The PNG is taken from a single Agg draw of the canvas rather than a second
+        savefig, which would re-run the renderer (twice, with bbox_inches='tight').
+        """
+        fig.savefig(self.output_dir / f'{stem}.pdf', bbox_inches='tight')
+        fig.canvas.draw()
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(plt.rcParams['savefig.pad_inches'])
+        x0, y0, x1, y1 = np.round(np.asarray(bbox.extents) * fig.dpi).astype(int)
+        rgba = np.asarray(fig.canvas.buffer_rgba())
+        height, width = rgba.shape[:2]
+        if x0 < 0 or y0 < 0 or x1 > width or y1 > height:
+            # Content spills past the canvas; let savefig grow it
+            fig.savefig(self.output_dir / f'{stem}.png', bbox_inches='tight')
+            return
+        # imsave writes the same dpi (pHYs) and Software metadata as savefig, so documents
+        # size the cropped PNG at print resolution
+        mpimg.imsave(self.output_dir / f'{stem}.png', rgba[height - y1:height - y0, x0:x1],
+                     format='png', dpi=fig.dpi)
     
-    def generate_all_figures(self):
-        """Generate all figures needed for publications."""
+    def generate_all_figures(self, workers: int | None = None):
+        """Generate all figures needed for publications.
+
+        Each figure is an independent file, so they are rendered in parallel
+        worker processes (one per CPU by default); with workers=1, or on a
+        single-CPU machine, they are rendered serially in this process.
+        """
         print("Generating publication figures...")
         
-        # Architecture figures
-        self.generate_architecture_overview()
-        self.generate_unified_vs_distributed()
-        self.generate_memory_system_architecture()
-        
-        # Performance figures
-        self.generate_scaling_performance()
-        self.generate_learning_convergence()
-        self.generate_assembly_formation()
-        
-        # Experimental results
-        self.generate_million_neuron_results()
-        self.generate_comparative_analysis()
-        self.generate_biological_realism()
-        
-        # Technical diagrams
-        self.generate_system_flow()
-        self.generate_neural_assembly_diagram()
+        workers = min(workers or os.cpu_count() or 1, len(_FIGURE_METHODS))
+        if workers <= 1:
+            for method in _FIGURE_METHODS:
+                getattr(self, method)()
+        else:
+            # Pool machinery is only needed here, so the serial path never imports it
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # spawn: children start clean instead of inheriting matplotlib state via fork
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                list(pool.map(_render_figure, repeat(str(self.output_dir)), _FIGURE_METHODS))
         
         print(f"All figures generated in: {self.output_dir}")
     
     def generate_architecture_overview(self):
         """Generate unified neural substrate architecture overview."""
-        fig, ax = plt.subplots(figsize=(self.fig_width, self.fig_height), dpi=self.dpi)
+        fig, ax = self._get_fig(figsize=(self.fig_width, self.fig_height))
         
         # Create architecture diagram
         components = [
@@ -82,17 +233,19 @@ class PublicationFigureGenerator:
             {'name': 'Neural Substrate', 'pos': (3, 0.5), 'color': self.colors['accent']},
         ]
         
-        # Draw components
-        for comp in components:
-            rect = FancyBboxPatch(
+        # Draw components (boxes go in as one collection)
+        ax.add_collection(PatchCollection([
+            FancyBboxPatch(
                 (comp['pos'][0]-0.4, comp['pos'][1]-0.3),
                 0.8, 0.6,
-                boxstyle="round,pad=0.1",
+                boxstyle=_boxstyle("round,pad=0.1"),
                 facecolor=comp['color'],
                 edgecolor='black',
                 alpha=0.7
             )
-            ax.add_patch(rect)
+            for comp in components
+        ], match_original=True))
+        for comp in components:
             ax.text(comp['pos'][0], comp['pos'][1], comp['name'], 
                    ha='center', va='center', fontsize=8, fontweight='bold')
         
@@ -102,23 +255,20 @@ class PublicationFigureGenerator:
             ((1, 2), (3, 2)), ((5, 2), (3, 2)), ((3, 2), (3, 0.5))
         ]
         
-        for start, end in connections:
-            ax.annotate('', xy=end, xytext=start,
-                       arrowprops=dict(arrowstyle='->', lw=1.5, color='gray'))
+        _add_arrows(ax, connections, arrowstyle='->', lw=1.5, color='gray')
         
         ax.set_xlim(0, 6)
         ax.set_ylim(0, 5)
         ax.set_title('Unified Neural Substrate Architecture', fontsize=12, fontweight='bold')
         ax.axis('off')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'architecture_overview.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'architecture_overview.png', bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_both(fig, 'architecture_overview')
+        fig.clf()
     
     def generate_unified_vs_distributed(self):
         """Generate comparison between unified and distributed architectures."""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(self.fig_width*1.5, self.fig_height), dpi=self.dpi)
+        fig, (ax1, ax2) = self._get_fig(1, 2, figsize=(self.fig_width*1.5, self.fig_height))
         
         # Distributed architecture
         ax1.set_title('Distributed Architecture', fontsize=10, fontweight='bold')
@@ -129,22 +279,23 @@ class PublicationFigureGenerator:
             {'name': 'Coordinator', 'pos': (3, 1), 'color': self.colors['accent']},
         ]
         
-        for comp in distributed_components:
-            rect = FancyBboxPatch(
+        ax1.add_collection(PatchCollection([
+            FancyBboxPatch(
                 (comp['pos'][0]-0.3, comp['pos'][1]-0.2),
                 0.6, 0.4,
-                boxstyle="round,pad=0.05",
+                boxstyle=_boxstyle("round,pad=0.05"),
                 facecolor=comp['color'],
                 alpha=0.7
             )
-            ax1.add_patch(rect)
+            for comp in distributed_components
+        ], match_original=True))
+        for comp in distributed_components:
             ax1.text(comp['pos'][0], comp['pos'][1], comp['name'], 
                     ha='center', va='center', fontsize=8)
         
         # Add coordination overhead
-        for pos in [(1, 3), (3, 3), (5, 3)]:
-            ax1.annotate('', xy=(3, 1), xytext=pos,
-                        arrowprops=dict(arrowstyle='<->', lw=1, color='red', linestyle='--'))
+        _add_arrows(ax1, [(pos, (3, 1)) for pos in [(1, 3), (3, 3), (5, 3)]],
+                    arrowstyle='<->', lw=1, color='red', linestyle='--')
         
         ax1.text(3, 2, 'Coordination\nOverhead', ha='center', va='center', 
                 fontsize=8, color='red', style='italic')
@@ -156,7 +307,7 @@ class PublicationFigureGenerator:
         ax2.set_title('Unified Architecture', fontsize=10, fontweight='bold')
         unified_rect = FancyBboxPatch(
             (1, 1), 4, 2,
-            boxstyle="round,pad=0.1",
+            boxstyle=_boxstyle("round,pad=0.1"),
             facecolor=self.colors['primary'],
             alpha=0.7
         )
@@ -172,22 +323,16 @@ class PublicationFigureGenerator:
         ax2.set_ylim(0, 4)
         ax2.axis('off')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'unified_vs_distributed.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'unified_vs_distributed.png', bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_both(fig, 'unified_vs_distributed')
+        fig.clf()
     
     def generate_scaling_performance(self):
         """Generate scaling performance graph."""
-        # Data from our scaling tests
-        neuron_counts = [64, 1000, 5000, 10000, 25000, 50000, 100000, 500000, 1000000]
-        steps_per_sec = [49.0, 49.2, 24.7, 12.5, 10.0, 5.0, 2.0, 0.5, 0.33]
-        memory_usage = [0.004, 0.064, 0.32, 0.64, 1.6, 3.2, 6.4, 32, 64]  # MB
-        
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(self.fig_width, self.fig_height*1.2), dpi=self.dpi)
+        fig, (ax1, ax2) = self._get_fig(2, 1, figsize=(self.fig_width, self.fig_height*1.2))
         
         # Processing performance
-        ax1.loglog(neuron_counts, steps_per_sec, 'o-', color=self.colors['primary'], 
+        ax1.loglog(_NEURON_COUNTS, _STEPS_PER_SEC, 'o-', color=self.colors['primary'], 
                   linewidth=2, markersize=6, label='NeuroForge')
         ax1.set_xlabel('Number of Neurons')
         ax1.set_ylabel('Processing Speed (steps/sec)')
@@ -204,7 +349,7 @@ class PublicationFigureGenerator:
                     fontsize=8, ha='center')
         
         # Memory usage
-        ax2.loglog(neuron_counts, memory_usage, 's-', color=self.colors['accent'], 
+        ax2.loglog(_NEURON_COUNTS, _MEMORY_MB, 's-', color=self.colors['accent'], 
                   linewidth=2, markersize=6, label='Memory Usage')
         ax2.set_xlabel('Number of Neurons')
         ax2.set_ylabel('Memory Usage (MB)')
@@ -213,30 +358,19 @@ class PublicationFigureGenerator:
         ax2.legend()
         
         # Add linear scaling reference
-        linear_ref = [n * 64e-6 for n in neuron_counts]  # 64 bytes per neuron
-        ax2.loglog(neuron_counts, linear_ref, '--', color='gray', alpha=0.7, label='Linear (64B/neuron)')
+        ax2.loglog(_NEURON_COUNTS, _LINEAR_REF_MB, '--', color='gray', alpha=0.7, label='Linear (64B/neuron)')
         ax2.legend()
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'scaling_performance.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'scaling_performance.png', bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_both(fig, 'scaling_performance')
+        fig.clf()
     
     def generate_learning_convergence(self):
         """Generate learning convergence plots."""
-        # Simulated learning data based on our test results
-        steps = np.arange(0, 1000, 10)
-        
-        # STDP learning curve
-        stdp_curve = 0.36 * (1 - np.exp(-steps/200)) + np.random.normal(0, 0.02, len(steps))
-        
-        # Hebbian learning curve  
-        hebbian_curve = 0.34 * (1 - np.exp(-steps/150)) + np.random.normal(0, 0.015, len(steps))
-        
-        # Combined learning
-        combined_curve = 0.75 * hebbian_curve + 0.25 * stdp_curve
+        # Simulated learning data based on our test results: STDP, Hebbian and combined curves
+        steps, stdp_curve, hebbian_curve, combined_curve = _learning_curves()
         
-        fig, ax = plt.subplots(figsize=(self.fig_width, self.fig_height), dpi=self.dpi)
+        fig, ax = self._get_fig(figsize=(self.fig_width, self.fig_height))
         
         ax.plot(steps, stdp_curve, label='STDP Only', color=self.colors['secondary'], linewidth=2)
         ax.plot(steps, hebbian_curve, label='Hebbian Only', color=self.colors['accent'], linewidth=2)
@@ -253,34 +387,30 @@ class PublicationFigureGenerator:
         ax.axhline(y=0.36, color='gray', linestyle='--', alpha=0.7)
         ax.text(500, 0.37, 'Convergence Level', fontsize=8, ha='center')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'learning_convergence.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'learning_convergence.png', bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_both(fig, 'learning_convergence')
+        fig.clf()
     
     def generate_assembly_formation(self):
         """Generate neural assembly formation visualization."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(self.fig_width*1.5, self.fig_height*1.2), dpi=self.dpi)
+        fig, ((ax1, ax2), (ax3, ax4)) = self._get_fig(2, 2, figsize=(self.fig_width*1.5, self.fig_height*1.2))
         
         # Assembly size distribution
-        assembly_sizes = [3, 5, 7, 12, 8, 15, 6, 9, 11, 4, 18, 7, 13, 6, 10]
-        ax1.hist(assembly_sizes, bins=8, color=self.colors['assembly'], alpha=0.7, edgecolor='black')
+        _stairs_hist(ax1, _ASSEMBLY_SIZE_HIST, self.colors['assembly'])
         ax1.set_xlabel('Assembly Size (neurons)')
         ax1.set_ylabel('Frequency')
         ax1.set_title('Assembly Size Distribution', fontsize=10, fontweight='bold')
         ax1.grid(True, alpha=0.3)
         
         # Cohesion scores
-        cohesion_scores = [1.2, 2.1, 1.8, 3.2, 1.5, 2.8, 1.9, 2.3, 2.7, 1.6, 3.1, 2.0, 2.5, 1.7, 2.4]
-        ax2.hist(cohesion_scores, bins=8, color=self.colors['neural'], alpha=0.7, edgecolor='black')
+        _stairs_hist(ax2, _COHESION_HIST, self.colors['neural'])
         ax2.set_xlabel('Cohesion Score')
         ax2.set_ylabel('Frequency')
         ax2.set_title('Assembly Cohesion Distribution', fontsize=10, fontweight='bold')
         ax2.grid(True, alpha=0.3)
         
         # Assembly formation over time
-        time_steps = np.arange(0, 100, 5)
-        assemblies_formed = np.cumsum(np.random.poisson(0.3, len(time_steps)))
+        time_steps, assemblies_formed = _assembly_timeline()
         ax3.plot(time_steps, assemblies_formed, 'o-', color=self.colors['primary'], linewidth=2, markersize=4)
         ax3.set_xlabel('Time Steps')
         ax3.set_ylabel('Cumulative Assemblies')
@@ -294,14 +424,13 @@ class PublicationFigureGenerator:
                colors=colors, startangle=90)
         ax4.set_title('Neuron Assembly Coverage', fontsize=10, fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'assembly_formation.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'assembly_formation.png', bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_both(fig, 'assembly_formation')
+        fig.clf()
     
     def generate_million_neuron_results(self):
         """Generate 1 million neuron test results visualization."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(self.fig_width*1.5, self.fig_height*1.2), dpi=self.dpi)
+        fig, ((ax1, ax2), (ax3, ax4)) = self._get_fig(2, 2, figsize=(self.fig_width*1.5, self.fig_height*1.2))
         
         # Region distribution
         regions = ['Visual\nCortex', 'Prefrontal\nCortex', 'Auditory\nCortex', 'Motor\nCortex', 
@@ -315,19 +444,16 @@ class PublicationFigureGenerator:
         ax1.tick_params(axis='x', rotation=45)
         
         # Add value labels on bars
-        for bar, count in zip(bars, neuron_counts):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 5000,
-                    f'{count//1000}K', ha='center', va='bottom', fontsize=8)
+        ax1.bar_label(bars, labels=[f'{count//1000}K' for count in neuron_counts], padding=3, fontsize=8)
         
         # Processing timeline
         phases = ['Initialization', 'Processing\nStep 1', 'Processing\nStep 2', 'Processing\nStep 3', 'Data Export']
         times = [30, 120, 120, 120, 30]  # seconds
         cumulative_times = np.cumsum([0] + times)
         
-        for i, (phase, time) in enumerate(zip(phases, times)):
-            ax2.barh(i, time, left=cumulative_times[i], color=self.colors['primary'], alpha=0.7)
-            ax2.text(cumulative_times[i] + time/2, i, f'{time}s', ha='center', va='center', fontsize=8)
+        timeline = ax2.barh(np.arange(len(phases)), times, left=cumulative_times[:-1],
+                            color=self.colors['primary'], alpha=0.7)
+        ax2.bar_label(timeline, labels=[f'{t}s' for t in times], label_type='center', fontsize=8)
         
         ax2.set_yticks(range(len(phases)))
         ax2.set_yticklabels(phases)
@@ -359,14 +485,13 @@ class PublicationFigureGenerator:
         ax4.set_ylabel('Value')
         ax4.set_title('System Performance Metrics', fontsize=10, fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'million_neuron_results.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'million_neuron_results.png', bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_both(fig, 'million_neuron_results')
+        fig.clf()
     
     def generate_comparative_analysis(self):
         """Generate comparative analysis with other approaches."""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(self.fig_width*1.5, self.fig_height), dpi=self.dpi)
+        fig, (ax1, ax2) = self._get_fig(1, 2, figsize=(self.fig_width*1.5, self.fig_height))
         
         # Performance comparison
         approaches = ['Transformer\n(GPT-4)', 'Distributed\nNeural', 'Spiking\nNetworks', 'NeuroForge\n(Unified)']
@@ -405,14 +530,13 @@ class PublicationFigureGenerator:
         ax2.legend()
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'comparative_analysis.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'comparative_analysis.png', bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_both(fig, 'comparative_analysis')
+        fig.clf()
     
     def generate_memory_system_architecture(self):
         """Generate detailed memory system architecture diagram."""
-        fig, ax = plt.subplots(figsize=(self.fig_width*1.2, self.fig_height*1.2), dpi=self.dpi)
+        fig, ax = self._get_fig(figsize=(self.fig_width*1.2, self.fig_height*1.2))
         
         # Memory systems with their characteristics
         memory_systems = [
@@ -425,17 +549,19 @@ class PublicationFigureGenerator:
             {'name': 'Neural Substrate', 'pos': (3, 0.2), 'size': (2.0, 0.4), 'color': 'lightgray', 'capacity': '1M+ Neurons'}
         ]
         
-        # Draw memory systems
-        for system in memory_systems:
-            rect = FancyBboxPatch(
+        # Draw memory systems (boxes go in as one collection)
+        ax.add_collection(PatchCollection([
+            FancyBboxPatch(
                 (system['pos'][0] - system['size'][0]/2, system['pos'][1] - system['size'][1]/2),
                 system['size'][0], system['size'][1],
-                boxstyle="round,pad=0.05",
+                boxstyle=_boxstyle("round,pad=0.05"),
                 facecolor=system['color'],
                 edgecolor='black',
                 alpha=0.7
             )
-            ax.add_patch(rect)
+            for system in memory_systems
+        ], match_original=True))
+        for system in memory_systems:
             ax.text(system['pos'][0], system['pos'][1] + 0.1, system['name'], 
                    ha='center', va='center', fontsize=9, fontweight='bold')
             ax.text(system['pos'][0], system['pos'][1] - 0.15, system['capacity'], 
@@ -443,27 +569,24 @@ class PublicationFigureGenerator:
         
         # Draw connections to integrator
         integrator_pos = (3, 1.5)
-        for system in memory_systems[:-2]:  # Exclude integrator and substrate
-            ax.annotate('', xy=integrator_pos, xytext=system['pos'],
-                       arrowprops=dict(arrowstyle='->', lw=1.5, color='gray'))
+        _add_arrows(ax, [(system['pos'], integrator_pos) for system in memory_systems[:-2]],  # Exclude integrator and substrate
+                    arrowstyle='->', lw=1.5, color='gray')
         
         # Connection from integrator to substrate
-        ax.annotate('', xy=(3, 0.2), xytext=integrator_pos,
-                   arrowprops=dict(arrowstyle='->', lw=2, color='black'))
+        _add_arrows(ax, [(integrator_pos, (3, 0.2))], arrowstyle='->', lw=2, color='black')
         
         ax.set_xlim(0, 6)
         ax.set_ylim(-0.5, 6)
         ax.set_title('Integrated Memory System Architecture', fontsize=12, fontweight='bold')
         ax.axis('off')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'memory_system_architecture.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'memory_system_architecture.png', bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_both(fig, 'memory_system_architecture')
+        fig.clf()
     
     def generate_biological_realism(self):
         """Generate biological realism comparison."""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(self.fig_width*1.5, self.fig_height), dpi=self.dpi)
+        fig, (ax1, ax2) = self._get_fig(1, 2, figsize=(self.fig_width*1.5, self.fig_height))
         
         # Biological features comparison
         features = ['Sparse\nConnectivity', 'STDP\nLearning', 'Hebbian\nPlasticity', 
@@ -506,14 +629,13 @@ class PublicationFigureGenerator:
         ax2.legend()
         ax2.set_ylim(0, 110)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'biological_realism.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'biological_realism.png', bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_both(fig, 'biological_realism')
+        fig.clf()
     
     def generate_system_flow(self):
         """Generate system flow diagram."""
-        fig, ax = plt.subplots(figsize=(self.fig_width*1.3, self.fig_height), dpi=self.dpi)
+        fig, ax = self._get_fig(figsize=(self.fig_width*1.3, self.fig_height))
         
         # Flow stages
         stages = [
@@ -543,14 +665,9 @@ class PublicationFigureGenerator:
             ((3, 1), (5, 1)),  # Memory -> Output
         ]
         
-        for start, end in flows:
-            if start == (1, 1) and end == (1, 3):  # Feedback arrow
-                ax.annotate('', xy=end, xytext=start,
-                           arrowprops=dict(arrowstyle='->', lw=2, color='red',
-                                         connectionstyle="arc3,rad=-0.3"))
-            else:
-                ax.annotate('', xy=end, xytext=start,
-                           arrowprops=dict(arrowstyle='->', lw=2, color='gray'))
+        feedback = ((1, 1), (1, 3))
+        _add_arrows(ax, [flow for flow in flows if flow != feedback], arrowstyle='->', lw=2, color='gray')
+        _add_arrows(ax, [feedback], arrowstyle='->', lw=2, color='red', connectionstyle="arc3,rad=-0.3")
         
         # Add labels
         ax.text(2, 3.5, 'Forward Processing', ha='center', fontsize=9, style='italic')
@@ -562,19 +679,18 @@ class PublicationFigureGenerator:
         ax.set_title('NeuroForge System Processing Flow', fontsize=12, fontweight='bold')
         ax.axis('off')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'system_flow.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'system_flow.png', bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_both(fig, 'system_flow')
+        fig.clf()
     
     def generate_neural_assembly_diagram(self):
         """Generate neural assembly formation diagram."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(self.fig_width*1.5, self.fig_height*1.2), dpi=self.dpi)
+        fig, ((ax1, ax2), (ax3, ax4)) = self._get_fig(2, 2, figsize=(self.fig_width*1.5, self.fig_height*1.2))
         
         # Individual neurons (before assembly)
-        np.random.seed(42)
-        neurons_x = np.random.uniform(0, 5, 20)
-        neurons_y = np.random.uniform(0, 5, 20)
+        rng = np.random.default_rng(42)
+        neurons_x = rng.uniform(0, 5, 20)
+        neurons_y = rng.uniform(0, 5, 20)
         
         ax1.scatter(neurons_x, neurons_y, c='lightblue', s=50, alpha=0.7, edgecolors='black')
         ax1.set_title('Individual Neurons', fontsize=10, fontweight='bold')
@@ -582,14 +698,11 @@ class PublicationFigureGenerator:
         ax1.set_ylim(0, 5)
         ax1.axis('off')
         
-        # Weak connections
-        for i in range(5):
-            start_idx = np.random.randint(0, 20)
-            end_idx = np.random.randint(0, 20)
-            if start_idx != end_idx:
-                ax1.plot([neurons_x[start_idx], neurons_x[end_idx]], 
-                        [neurons_y[start_idx], neurons_y[end_idx]], 
-                        'gray', alpha=0.3, linewidth=0.5)
+        # Weak connections: five random pairs, self-loops dropped
+        neuron_pos = np.column_stack([neurons_x, neurons_y])
+        pairs = rng.integers(0, 20, size=(5, 2))
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        ax1.add_collection(LineCollection(neuron_pos[pairs], colors='gray', alpha=0.3, linewidths=0.5, zorder=2))
         
         # Assembly formation (intermediate)
         assembly1_indices = [0, 1, 2, 5, 8]
@@ -606,14 +719,11 @@ class PublicationFigureGenerator:
         ax2.scatter(neurons_x[other_indices], neurons_y[other_indices], 
                    c='lightgray', s=50, alpha=0.5, edgecolors='black')
         
-        # Strong intra-assembly connections
+        # Strong intra-assembly connections: every pair, one collection per assembly
         for indices, color in [(assembly1_indices, self.colors['assembly']), 
                               (assembly2_indices, self.colors['neural'])]:
-            for i in range(len(indices)):
-                for j in range(i+1, len(indices)):
-                    ax2.plot([neurons_x[indices[i]], neurons_x[indices[j]]], 
-                            [neurons_y[indices[i]], neurons_y[indices[j]]], 
-                            color=color, alpha=0.6, linewidth=2)
+            pairs = np.array(list(combinations(indices, 2)))
+            ax2.add_collection(LineCollection(neuron_pos[pairs], colors=color, alpha=0.6, linewidths=2, zorder=2))
         
         ax2.set_title('Assembly Formation', fontsize=10, fontweight='bold')
         ax2.set_xlim(0, 5)
@@ -622,8 +732,7 @@ class PublicationFigureGenerator:
         ax2.axis('off')
         
         # Assembly binding strength over time
-        time = np.linspace(0, 100, 50)
-        binding_strength = 1 - np.exp(-time/30) + 0.1 * np.sin(time/5)
+        time, binding_strength = _binding_curve()
         
         ax3.plot(time, binding_strength, color=self.colors['primary'], linewidth=2)
         ax3.fill_between(time, 0, binding_strength, alpha=0.3, color=self.colors['primary'])
@@ -632,21 +741,22 @@ class PublicationFigureGenerator:
         ax3.set_title('Assembly Binding Dynamics', fontsize=10, fontweight='bold')
         ax3.grid(True, alpha=0.3)
         
-        # Assembly network graph
-        G = nx.Graph()
+        # Assembly network graph: four assemblies on a square, A2-A4 on the diagonal
         assembly_nodes = ['A1', 'A2', 'A3', 'A4']
-        G.add_nodes_from(assembly_nodes)
-        G.add_edges_from([('A1', 'A2'), ('A2', 'A3'), ('A3', 'A4'), ('A1', 'A4'), ('A2', 'A4')])
-        
-        pos = nx.spring_layout(G)
-        nx.draw(G, pos, ax=ax4, with_labels=True, node_color=self.colors['assembly'], 
-                node_size=800, font_size=10, font_weight='bold', edge_color='gray')
+        node_pos = np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=float)
+        assembly_edges = np.array([[0, 1], [1, 2], [2, 3], [0, 3], [1, 3]])
+        ax4.add_collection(LineCollection(node_pos[assembly_edges], colors='gray', linewidths=1.0, zorder=1))
+        ax4.scatter(node_pos[:, 0], node_pos[:, 1], s=800, c=self.colors['assembly'], zorder=2)
+        for name, (x, y) in zip(assembly_nodes, node_pos):
+            ax4.text(x, y, name, ha='center', va='center', fontsize=10, fontweight='bold', zorder=3)
+        ax4.set_xlim(-0.3, 1.3)
+        ax4.set_ylim(-0.3, 1.3)
+        ax4.axis('off')
         ax4.set_title('Assembly Network Topology', fontsize=10, fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'neural_assembly_diagram.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'neural_assembly_diagram.png', bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_both(fig, 'neural_assembly_diagram')
+        fig.clf()
 
 def main():
     """Generate all publication figures."""
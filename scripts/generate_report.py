@@ -9,30 +9,125 @@ Sections:
 """
 import os
 import csv
-import glob
+import heapq
+import io
+import json
 from pathlib import Path
-import subprocess
 from datetime import datetime
 
 
-def read_csv_rows(path: Path):
-    rows = []
+def iter_csv_rows(path: Path, with_header: bool = False):
+    """Yield data rows one at a time (the header first if with_header, else skipped); yields nothing if the file is missing."""
     if not path.exists():
-        return rows
-    with open(path, 'r', encoding='utf-8') as f:
+        return
+    with open(path, 'r', encoding='utf-8', buffering=1 << 20, newline='') as f:
         r = csv.reader(f)
-        headers = next(r, None)
-        for row in r:
-            rows.append(row)
-    return rows
+        if not with_header:
+            next(r, None)
+        yield from r
+
+
+def append_table(w, heading, rows, cells):
+    """Write a Markdown table through w() straight from a row iterator; nothing at all when there are no rows."""
+    for i, row in enumerate(rows):
+        if i == 0:
+            for line in heading:
+                w(line)
+        w('| ' + ' | '.join(cells(row)) + ' |')
+
+
+def derived_cells(header):
+    """Row formatter for time_series_metrics.csv with its columns resolved once from the header.
+
+    file, series_name, experiment, steps_total, steps_min, steps_max, time_to_first_assembly,
+    median_coherence_last_X, damping_ratio_X, final_assemblies, growth_total (X is the --window)
+    """
+    def col(prefix, default):
+        return next((i for i, name in enumerate(header) if name.startswith(prefix)), default)
+
+    tffa_idx = col('time_to_first_assembly', 6)
+    med_idx = col('median_coherence_last', 7)
+    damp_idx = col('damping_ratio', 8)
+    growth_idx = col('growth_total', 10)
+
+    def cells(row):
+        n = len(row)
+        return [row[1], row[2],
+                row[tffa_idx] if tffa_idx < n else '',
+                row[med_idx] if med_idx < n else '',
+                row[damp_idx] if damp_idx < n else '',
+                row[growth_idx] if growth_idx < n else '']
+    return cells
+
+
+def find_png(root, strip=0):
+    """Yield every *.png path under root (hidden entries skipped, like glob's '**'); DirEntry caches the type.
+
+    The first strip characters are cut from each path and separators become '/', so passing
+    len(str(base)) + 1 yields Markdown-ready paths relative to base.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_png(entry.path, strip)
+            elif entry.name.endswith('.png') and entry.is_file():
+                yield entry.path[strip:].replace(os.sep, '/')
+
+
+def resolve_head_sha(repo_root: Path):
+    """Full HEAD commit id read straight from .git (loose or packed ref); None when it can't be read that way."""
+    git_dir = repo_root / '.git'
+    try:
+        head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+        if not head.startswith('ref: '):
+            return head or None  # detached HEAD
+        ref = head[len('ref: '):]
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            return ref_path.read_text(encoding='utf-8').strip() or None
+        with open(git_dir / 'packed-refs', 'r', encoding='utf-8') as f:
+            for line in f:
+                sha, _, name = line.rstrip('\n').partition(' ')
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    return None
+
+
+def git_short_commit(repo_root: Path, cache_path: Path):
+    """`git rev-parse --short HEAD`, memoized in cache_path against the full HEAD id so repeat runs skip the fork."""
+    full = resolve_head_sha(repo_root)
+    if full:
+        try:
+            cached = json.loads(cache_path.read_text(encoding='utf-8'))
+            if cached.get('sha') == full and cached.get('short'):
+                return cached['short']
+        except (OSError, ValueError, AttributeError):
+            pass
+    # Only reached on a cache miss, so subprocess is imported here rather than at startup
+    import subprocess
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=str(repo_root)).decode('utf-8').strip()
+    except Exception:
+        return None
+    if full:
+        try:
+            cache_path.write_text(json.dumps({'sha': full, 'short': commit}), encoding='utf-8')
+        except OSError:
+            pass
+    return commit
 
 
 def embed_images_md(paths):
-    lines = []
-    for p in paths:
-        rel = p.replace('\\', '/')
-        lines.append(f"![]({rel})")
-    return '\n\n'.join(lines)
+    # paths are already relative to the repo root with '/' separators
+    return '\n\n'.join(f"![]({p})" for p in paths)
 
 
 def main():
@@ -46,24 +141,25 @@ def main():
     collated_summary = artifacts / 'SUMMARY' / 'all_results.csv'
     derived_metrics = artifacts / 'CSV' / 'derived' / 'time_series_metrics.csv'
     stats_summary = artifacts / 'CSV' / 'stats' / 'stat_tests_summary.csv'
-    analysis_rows = read_csv_rows(analysis_summary)
-    collated_rows = read_csv_rows(collated_summary)
-    derived_rows = read_csv_rows(derived_metrics)
-    stats_rows = read_csv_rows(stats_summary)
 
     # Figures
-    bench_figs = sorted(glob.glob(str(artifacts / 'PNG' / 'benchmarks' / '**' / '*.png'), recursive=True))
-    analysis_figs = sorted(glob.glob(str(artifacts / 'PNG' / 'analysis' / '**' / '*.png'), recursive=True))
+    # Only the first 12 (by path) of each tree are embedded, so keep a bounded heap instead of sorting everything
+    # The walker emits repo-relative paths directly, so no per-figure relpath is needed
+    strip = len(str(repo_root)) + 1
+    bench_figs = heapq.nsmallest(12, find_png(artifacts / 'PNG' / 'benchmarks', strip))
+    analysis_figs = heapq.nsmallest(12, find_png(artifacts / 'PNG' / 'analysis', strip))
 
     # Build report
-    lines = []
-    lines.append(f"# NeuroForge Benchmark & Analysis Report\n")
+    # Lines accumulate in memory and REPORT.md is written once at the end, so a failed run leaves the old report intact
+    buf = io.StringIO()
+
+    def w(line):
+        buf.write(line)
+        buf.write('\n')
+
+    w(f"# NeuroForge Benchmark & Analysis Report\n")
     # Git commit and build info
-    commit = None
-    try:
-        commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=str(repo_root)).decode('utf-8').strip()
-    except Exception:
-        commit = None
+    commit = git_short_commit(repo_root, artifacts / '.git_commit.json')
     exe_path = repo_root / 'build' / 'neuroforge.exe'
     build_info = None
     if exe_path.exists():
@@ -74,92 +170,79 @@ def main():
         except Exception:
             build_info = None
 
-    lines.append(f"Generated: {datetime.utcnow().isoformat()}Z\n")
+    w(f"Generated: {datetime.utcnow().isoformat()}Z\n")
     if commit:
-        lines.append(f"Commit: `{commit}`")
+        w(f"Commit: `{commit}`")
     if build_info:
-        lines.append(f"Build: `{exe_path}` ({build_info})")
-
-    lines.append("## Overview")
-    lines.append("- Artifacts root: `Artifacts/`")
-    lines.append("- Includes unified substrate benchmarks, Transformer embeddings, RSA/CKA analysis, and CSV summaries.")
-
-    if analysis_rows:
-        lines.append("\n## Analyzer Summary (analysis_summary.csv)")
-        lines.append("| file | rows | steps_min | steps_max | coh_mean | coh_var | asm_final | growth_total |")
-        lines.append("|---|---:|---:|---:|---:|---:|---:|---:|")
-        for row in analysis_rows:
-            # file, rows, steps_min, steps_max, coh_mean, coh_var, asm_final, growth_total
-            cells = [row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7]]
-            lines.append('| ' + ' | '.join(cells) + ' |')
-
-    if collated_rows:
-        lines.append("\n## Collated Results (SUMMARY/all_results.csv)")
-        lines.append("| experiment | file | layer | metric | value |")
-        lines.append("|---|---|---:|---|---:|")
-        for row in collated_rows:
-            # experiment, file, layer, metric, value
-            cells = [row[0], row[1], row[2], row[3], row[4]]
-            lines.append('| ' + ' | '.join(cells) + ' |')
-
-    if derived_rows:
-        lines.append("\n## Derived Time-Series Metrics (time_series_metrics.csv)")
-        lines.append("| series_name | experiment | time_to_first_assembly | median_coherence_last | damping_ratio | growth_total |")
-        lines.append("|---|---|---:|---:|---:|---:|")
-        # Find indices by header
-        # file, series_name, experiment, steps_total, steps_min, steps_max, time_to_first_assembly, median_coherence_last_X, damping_ratio_X, final_assemblies, growth_total
-        for row in derived_rows:
-            series_name = row[1]
-            experiment = row[2]
-            tffa = row[6]
-            # Search for median and damping columns
-            med = next((c for c in row[7:10] if c != ''), '')
-            damp = next((c for c in row[7:10] if c != '' and c != med), '')
-            growth = row[10] if len(row) > 10 else ''
-            cells = [series_name, experiment, tffa, med, damp, growth]
-            lines.append('| ' + ' | '.join(cells) + ' |')
-
-    if stats_rows:
-        lines.append("\n## Statistical Tests (stat_tests_summary.csv)")
-        lines.append("| metric | layer | mean_diff | 95% CI low | 95% CI high | p (t) | p (Wilcoxon) | n_pairs |")
-        lines.append("|---|---|---:|---:|---:|---:|---:|---:|")
-        for row in stats_rows:
-            # metric, layer, mean_diff, t_p, w_p, boot_low, boot_high, n_pairs
-            cells = [row[0], row[1], row[2], row[5], row[6], row[3], row[4], row[7]]
-            lines.append('| ' + ' | '.join(cells) + ' |')
+        w(f"Build: `{exe_path}` ({build_info})")
+
+    w("## Overview")
+    w("- Artifacts root: `Artifacts/`")
+    w("- Includes unified substrate benchmarks, Transformer embeddings, RSA/CKA analysis, and CSV summaries.")
+
+    # Tables are emitted while each CSV streams past; nothing is held beyond the current row
+    append_table(w, [
+        "\n## Analyzer Summary (analysis_summary.csv)",
+        "| file | rows | steps_min | steps_max | coh_mean | coh_var | asm_final | growth_total |",
+        "|---|---:|---:|---:|---:|---:|---:|---:|",
+    ], iter_csv_rows(analysis_summary), lambda row: row[:8])  # file, rows, steps_min, steps_max, coh_mean, coh_var, asm_final, growth_total
+
+    append_table(w, [
+        "\n## Collated Results (SUMMARY/all_results.csv)",
+        "| experiment | file | layer | metric | value |",
+        "|---|---|---:|---|---:|",
+    ], iter_csv_rows(collated_summary), lambda row: row[:5])  # experiment, file, layer, metric, value
+
+    derived_rows = iter_csv_rows(derived_metrics, with_header=True)
+    derived_header = next(derived_rows, [])
+    append_table(w, [
+        "\n## Derived Time-Series Metrics (time_series_metrics.csv)",
+        "| series_name | experiment | time_to_first_assembly | median_coherence_last | damping_ratio | growth_total |",
+        "|---|---|---:|---:|---:|---:|",
+    ], derived_rows, derived_cells(derived_header))
+
+    # Key narrative stats are picked out during the same pass that writes the stats table
+    metric_map = {
+        'time_to_first_assembly': 'Time-to-first-assembly',
+        'median_coherence_last_300': 'Median coherence (last 300)',
+        'damping_ratio_300': 'Damping ratio (late/early)'
+    }
+    key_rows = {}
+
+    def note_key_rows(rows):
+        for row in rows:
+            if row[0] in metric_map and row[0] not in key_rows:
+                key_rows[row[0]] = row
+            yield row
+
+    append_table(w, [
+        "\n## Statistical Tests (stat_tests_summary.csv)",
+        "| metric | layer | mean_diff | 95% CI low | 95% CI high | p (t) | p (Wilcoxon) | n_pairs |",
+        "|---|---|---:|---:|---:|---:|---:|---:|",
+    ], note_key_rows(iter_csv_rows(stats_summary)),
+        # metric, layer, mean_diff, t_p, w_p, boot_low, boot_high, n_pairs
+        lambda row: [row[0], row[1], row[2], row[5], row[6], row[3], row[4], row[7]])
 
     if bench_figs:
-        lines.append("\n## Benchmark Figures")
+        w("\n## Benchmark Figures")
         # Embed up to 12 benchmark images
-        lines.append(embed_images_md([os.path.relpath(p, repo_root) for p in bench_figs[:12]]))
+        w(embed_images_md(bench_figs))
 
     if analysis_figs:
-        lines.append("\n## Analysis Figures (RSA/CKA)")
+        w("\n## Analysis Figures (RSA/CKA)")
         # Embed up to 12 analysis images
-        lines.append(embed_images_md([os.path.relpath(p, repo_root) for p in analysis_figs[:12]]))
+        w(embed_images_md(analysis_figs))
 
     # Stats plots
     stats_fig = artifacts / 'PNG' / 'stats' / 'stat_tests_boxplots.png'
     if stats_fig.exists():
-        lines.append("\n## Statistical Plots")
-        lines.append(embed_images_md([os.path.relpath(str(stats_fig), repo_root)]))
+        w("\n## Statistical Plots")
+        w(embed_images_md([stats_fig.relative_to(repo_root).as_posix()]))
 
     # Narrative summary (template)
     try:
-        lines.append("\n## System & Cognitive Performance (Template)")
-        lines.append("This section summarizes throughput, functional behavior, representational alignment, decodability, and dynamics with statistical validation.")
-        # Pull key stats if available
-        key_rows = {}
-        metric_map = {
-            'time_to_first_assembly': 'Time-to-first-assembly',
-            'median_coherence_last_300': 'Median coherence (last 300)',
-            'damping_ratio_300': 'Damping ratio (late/early)'
-        }
-        if stats_rows:
-            for row in stats_rows:
-                m = row[0]
-                if m in metric_map and m not in key_rows:
-                    key_rows[m] = row
+        w("\n## System & Cognitive Performance (Template)")
+        w("This section summarizes throughput, functional behavior, representational alignment, decodability, and dynamics with statistical validation.")
         # Compose sentences
         paragraph = []
         if key_rows.get('time_to_first_assembly'):
@@ -172,13 +255,13 @@ def main():
             r = key_rows['damping_ratio_300']
             paragraph.append(f"Adaptive lowers {metric_map['damping_ratio_300']} by {float(r[2]):.2f} (95% CI [{r[5]}, {r[6]}], t-p={r[3]}, w-p={r[4]}), indicating stabilization.")
         if paragraph:
-            lines.append(' '.join(paragraph))
+            w(' '.join(paragraph))
         else:
-            lines.append("Template: Add sentences here summarizing A/B differences (time-to-assembly, coherence, damping) and RSA/CKA alignment.")
+            w("Template: Add sentences here summarizing A/B differences (time-to-assembly, coherence, damping) and RSA/CKA alignment.")
     except Exception:
         pass
 
-    out_md.write_text('\n'.join(lines), encoding='utf-8')
+    out_md.write_text(buf.getvalue(), encoding='utf-8')
     print(f"Wrote report → {out_md}")
 
 
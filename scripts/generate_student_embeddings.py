@@ -1,60 +1,56 @@
 import argparse
+import multiprocessing
 import os
 import sys
 
-try:
-    from PIL import Image
-except Exception:
-    Image = None
+# numpy and Pillow are imported where they are used, so --help and argument errors
+# return without loading them; repeat imports are a sys.modules lookup
 
 def load_image_embedding(path, grid, iw, ew):
-    if Image is None:
+    try:
+        from PIL import Image
+    except Exception:
         raise RuntimeError("Pillow not available; install with: pip install pillow")
+    import numpy as np
     img = Image.open(path).convert('L').resize((grid, grid))
-    pix = list(img.getdata())
-    vals = [p / 255.0 for p in pix]
-    w = grid
-    h = grid
-    sob_x = [[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]]
-    sob_y = [[-1, -2, -1], [0, 0, 0], [1, 2, 1]]
-    gx = [0.0] * (w * h)
-    gy = [0.0] * (w * h)
-    for y in range(h):
-        for x in range(w):
-            sx = 0.0
-            sy = 0.0
-            for j in range(-1, 2):
-                for i in range(-1, 2):
-                    xi = x + i
-                    yj = y + j
-                    if xi < 0: xi = 0
-                    if xi >= w: xi = w - 1
-                    if yj < 0: yj = 0
-                    if yj >= h: yj = h - 1
-                    v = vals[yj * w + xi]
-                    sx += sob_x[j + 1][i + 1] * v
-                    sy += sob_y[j + 1][i + 1] * v
-            gx[y * w + x] = sx
-            gy[y * w + x] = sy
-    edge = [abs(gx[i]) + abs(gy[i]) for i in range(w * h)]
-    vec = [iw * vals[i] + ew * edge[i] for i in range(w * h)]
-    n2 = sum(v * v for v in vec)
+    vals = np.asarray(img, dtype=np.float64) / 255.0
+    # Separable 3x3 Sobel on the edge-clamped image: a central difference along one axis,
+    # [1, 2, 1] smoothing along the other
+    p = np.pad(vals, 1, mode='edge')
+    dx = p[:, 2:] - p[:, :-2]
+    dy = p[2:, :] - p[:-2, :]
+    gx = dx[:-2] + 2 * dx[1:-1] + dx[2:]
+    gy = dy[:, :-2] + 2 * dy[:, 1:-1] + dy[:, 2:]
+    # Fold |gx| + |gy| and the weighted sum into gx's buffer; n2 is a single dot product
+    vec = np.abs(gx, out=gx)
+    vec += np.abs(gy, out=gy)
+    vec *= ew
+    vec += iw * vals
+    vec = vec.ravel()
+    n2 = float(vec @ vec)
     if n2 <= 1e-12:
-        vec = [1.0] * (w * h)
-        n2 = float(w * h)
-    inv = n2 ** 0.5
-    vec = [v / inv for v in vec]
-    return vec
+        vec = np.ones(grid * grid)
+        n2 = float(grid * grid)
+    return vec / n2 ** 0.5
 
 def write_embedding(vec, out_path, precision):
-    fmt = "{:." + str(precision) + "f}"
-    with open(out_path, 'w', encoding='utf-8') as f:
-        f.write(" ".join(fmt.format(v) for v in vec))
+    import numpy as np
+    # One space-separated line, no trailing newline; savetxt formats the row in a single pass
+    np.savetxt(out_path, np.atleast_2d(vec), fmt='%.' + str(precision) + 'f', delimiter=' ', newline='', encoding='utf-8')
 
 def process_single(input_path, output_path, grid, iw, ew, precision):
     vec = load_image_embedding(input_path, grid, iw, ew)
     write_embedding(vec, output_path, precision)
 
+def _embed_task(task):
+    # Pool worker: (file, output path, error or None) so one bad image never aborts the batch
+    f, ip, op, grid, iw, ew, precision = task
+    try:
+        process_single(ip, op, grid, iw, ew, precision)
+        return f, op, None
+    except Exception as e:
+        return f, op, str(e)
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument('--input', type=str)
@@ -65,6 +61,7 @@ def main():
     ap.add_argument('--intensity-weight', type=float, default=0.4)
     ap.add_argument('--edge-weight', type=float, default=0.6)
     ap.add_argument('--precision', type=int, default=6)
+    ap.add_argument('--workers', type=int, default=0, help='Processes for --input-dir (0 = one per CPU)')
     args = ap.parse_args()
 
     if not args.input and not args.input_dir:
@@ -93,15 +90,21 @@ def main():
         if not files:
             print('No images found in', args.input_dir)
             sys.exit(0)
-        for f in files:
-            ip = os.path.join(args.input_dir, f)
-            name, _ = os.path.splitext(f)
-            op = os.path.join(out_dir, name + '_embed.txt')
-            try:
-                process_single(ip, op, args.grid_size, args.intensity_weight, args.edge_weight, args.precision)
-                print('Wrote', op)
-            except Exception as e:
-                print('Skip', f, 'due to', str(e))
+        tasks = [(f, os.path.join(args.input_dir, f), os.path.join(out_dir, os.path.splitext(f)[0] + '_embed.txt'),
+                  args.grid_size, args.intensity_weight, args.edge_weight, args.precision) for f in files]
+        workers = min(args.workers or os.cpu_count() or 1, len(tasks))
+        def report(results):
+            for f, op, err in results:
+                if err is None:
+                    print('Wrote', op)
+                else:
+                    print('Skip', f, 'due to', err)
+        if workers <= 1:
+            report(map(_embed_task, tasks))
+        else:
+            # Images are independent and CPU-bound; results print as they finish
+            with multiprocessing.Pool(workers) as pool:
+                report(pool.imap_unordered(_embed_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
 
 if __name__ == '__main__':
     main()
@@ -4,6 +4,7 @@ Generate small-multiples figures from Phase C sweep_summary.csv.
 
 - Reads: build/Release/Sweeps/sweep_summary.csv (default)
 - Produces: build/Release/Sweeps/SmallMultiples_SequenceAccuracy.svg (+ optional PNG)
+  (with --metrics: one SmallMultiples_<Metric>.svg/.png per metric, drawn into one reused figure)
 
 Layout:
 - One heatmap per capacity value
@@ -16,94 +17,121 @@ Standard library + matplotlib only.
 """
 import argparse
 import csv
+import hashlib
 import os
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 import json
 
-# Matplotlib headless backend
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.colors import Normalize
-from matplotlib.cm import ScalarMappable
-from matplotlib.patches import Rectangle
-from matplotlib.colors import to_rgb, LinearSegmentedColormap
-
-
-def read_summary_csv(path: str) -> List[Dict[str, str]]:
-    rows: List[Dict[str, str]] = []
-    with open(path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            rows.append(r)
+
+# matplotlib (~0.5 s to import) is loaded inside the drawing functions, so --help and
+# argument/CSV errors exit without it
+if TYPE_CHECKING:
+    from matplotlib.colors import LinearSegmentedColormap
+
+
+def read_summary_csv(path: str) -> Dict[str, Tuple[Optional[str], ...]]:
+    """Read the summary as {column: values}: plain csv.reader rows transposed once, no per-row dict.
+
+    Short rows pad with None and blank lines are skipped, as csv.DictReader would; each row is
+    fitted to the header before transposing, so every header name keeps a full-length column.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        width = len(header)
+        pad = (None,) * width
+        rows = [tuple(row[:width]) + pad[len(row):] for row in reader if row]
     if not rows:
         raise RuntimeError(f"No rows found in summary CSV: {path}")
-    return rows
+    return dict(zip(header, zip(*rows)))
 
 
-def parse_unique(values: List[str], cast):
+def parse_unique(values: Sequence[str], cast):
     uniq = sorted({cast(v) for v in values})
     return uniq
 
 
-def prepare_grids(rows: List[Dict[str, str]], metric_col: str):
-    capacities = parse_unique([r['capacity'] for r in rows], int)
-    decays = parse_unique([r['decay'] for r in rows], float)
-    windows = parse_unique([r['seq_window'] for r in rows], int)
-
-    # Build maps per capacity -> (decay, window) -> (metric_val, n)
-    by_cap: Dict[int, Dict[Tuple[float, int], Tuple[float, int]]] = defaultdict(dict)
-    for r in rows:
+def prepare_grids(columns: Dict[str, Tuple[Optional[str], ...]], metric_col: str):
+    capacities = parse_unique(columns['capacity'], int)
+    decays = parse_unique(columns['decay'], float)
+    windows = parse_unique(columns['seq_window'], int)
+    missing = (None,) * len(columns['capacity'])
+
+    # Parse each row once into flat columns; matrices are then filled by one scatter
+    caps: List[int] = []
+    decs: List[float] = []
+    wins: List[int] = []
+    vals: List[float] = []
+    ns: List[int] = []
+    for cap_s, dec_s, win_s, val_str, n in zip(columns['capacity'], columns['decay'], columns['seq_window'],
+                                               columns.get(metric_col, missing), columns.get('sequence_n', missing)):
         try:
-            cap = int(r['capacity'])
-            dec = float(r['decay'])
-            win = int(r['seq_window'])
-            val_str = r.get(metric_col)
-            n = r.get('sequence_n')
+            cap = int(cap_s)
+            dec = float(dec_s)
+            win = int(win_s)
             val = float(val_str) if (val_str is not None and val_str != '' and str(val_str).lower() != 'none') else np.nan
             n_i = int(n) if (n is not None and n != '') else 0
         except Exception:
             # Skip malformed row
             continue
-        by_cap[cap][(dec, win)] = (val, n_i)
+        caps.append(cap)
+        decs.append(dec)
+        wins.append(win)
+        vals.append(val)
+        ns.append(n_i)
+
+    # capacity -> (val_mat, n_mat), each shaped (len(decays), len(windows)); cells without a row stay NaN / 0
+    C, H, W = len(capacities), len(decays), len(windows)
+    val_all = np.full(C * H * W, np.nan, dtype=float)
+    n_all = np.zeros(C * H * W, dtype=int)
+    if caps:
+        flat = ((np.searchsorted(capacities, caps) * H + np.searchsorted(decays, decs)) * W
+                + np.searchsorted(windows, wins))
+        # Repeated (capacity, decay, seq_window) rows: the last one wins
+        _, rev_first = np.unique(flat[::-1], return_index=True)
+        last = len(flat) - 1 - rev_first
+        val_all[flat[last]] = np.asarray(vals, dtype=float)[last]
+        n_all[flat[last]] = np.asarray(ns, dtype=int)[last]
+    val_all = val_all.reshape(C, H, W)
+    n_all = n_all.reshape(C, H, W)
+    by_cap: Dict[int, Tuple[np.ndarray, np.ndarray]] = {
+        cap: (val_all[c], n_all[c]) for c, cap in enumerate(capacities)
+    }
 
     return capacities, decays, windows, by_cap
 
 
-def build_matrix(decays: List[float], windows: List[int], grid: Dict[Tuple[float, int], Tuple[float, int]]):
-    H = len(decays)
-    W = len(windows)
-    val_mat = np.full((H, W), np.nan, dtype=float)
-    n_mat = np.zeros((H, W), dtype=int)
-    for i, d in enumerate(decays):
-        for j, w in enumerate(windows):
-            val, n = grid.get((d, w), (np.nan, 0))
-            val_mat[i, j] = val
-            n_mat[i, j] = n
-    return val_mat, n_mat
-
-
-def compute_global_range(capacities, decays, windows, by_cap):
-    mins = []
-    maxs = []
-    for cap in capacities:
-        val_mat, _ = build_matrix(decays, windows, by_cap.get(cap, {}))
-        if not np.all(np.isnan(val_mat)):
-            mins.append(np.nanmin(val_mat))
-            maxs.append(np.nanmax(val_mat))
-    if not mins or not maxs:
+def compute_global_range(by_cap: Dict[int, Tuple[np.ndarray, np.ndarray]]) -> Tuple[float, float]:
+    """Shared color range over every panel: one nanmin/nanmax over the stacked matrices, (0, 1) if unusable."""
+    if not by_cap:
         return 0.0, 1.0
-    vmin = float(min(mins))
-    vmax = float(max(maxs))
+    vals = np.stack([val_mat for val_mat, _ in by_cap.values()])
+    if np.isnan(vals).all():
+        return 0.0, 1.0
+    vmin = float(np.nanmin(vals))
+    vmax = float(np.nanmax(vals))
     if not np.isfinite(vmin) or not np.isfinite(vmax) or vmin == vmax:
         return 0.0, 1.0
     return vmin, vmax
 
 
-def make_brand_cmap(accent_hex: str) -> LinearSegmentedColormap:
-    """Construct a light -> accent -> dark ramp based on a brand accent color."""
+def best_cell(val_mat: np.ndarray) -> Optional[Tuple[int, int]]:
+    """(row, col) of the first maximum ignoring NaN, in one nanargmax pass; None if every cell is NaN."""
+    if np.isnan(val_mat).all():
+        return None
+    i, j = np.unravel_index(np.nanargmax(val_mat), val_mat.shape)
+    return int(i), int(j)
+
+
+@lru_cache(maxsize=64)
+def make_brand_cmap(accent_hex: str) -> 'LinearSegmentedColormap':
+    """Construct a light -> accent -> dark ramp based on a brand accent color.
+
+    Pure in accent_hex, so the colormap is built once per color and shared; callers must not mutate it.
+    """
+    from matplotlib.colors import LinearSegmentedColormap, to_rgb
     r, g, b = to_rgb(accent_hex)
     # Lighten toward white (85%) and darken toward black (25%)
     light = (1 - 0.85 * (1 - r), 1 - 0.85 * (1 - g), 1 - 0.85 * (1 - b))
@@ -119,19 +147,39 @@ def plot_small_multiples(capacities, decays, windows, by_cap, out_svg: str,
                          font_scale: float = 1.0,
                          metric: str = 'sequence_accuracy',
                          cmap=None,
-                         json_only: bool = False):
+                         json_only: bool = False,
+                         fig=None,
+                         value_range: Optional[Tuple[float, float]] = None):
+    """Draw and save one metric's panels; returns the Figure so a caller rendering several metrics can pass it back in.
+
+    A passed-in Figure (same capacities, hence same size) is cleared and redrawn instead of building a new one.
+    value_range, when the caller already has it, skips recomputing the shared color range.
+    """
+    # Matplotlib headless backend
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.cm import ScalarMappable
+    from matplotlib.colors import LinearSegmentedColormap, Normalize
+    from matplotlib.patches import Rectangle
+
     # One panel per capacity
     n_caps = len(capacities)
     fig_w = max(5.0, 4.0 * n_caps)
     fig_h = 6.0
-    fig, axes = plt.subplots(1, n_caps, figsize=(fig_w, fig_h), squeeze=False)
-    axes = axes[0]
+    if fig is None:
+        fig = plt.figure(figsize=(fig_w, fig_h))
+    else:
+        fig.clf()
+    axes = fig.subplots(1, n_caps, squeeze=False)[0]
 
     # Decide normalization
     if metric == 'sequence_accuracy':
         vmin, vmax = 0.0, 1.0
+    elif value_range is not None:
+        vmin, vmax = value_range
     else:
-        vmin, vmax = compute_global_range(capacities, decays, windows, by_cap)
+        vmin, vmax = compute_global_range(by_cap)
     norm = Normalize(vmin=vmin, vmax=vmax)
     if cmap is None:
         cmap = plt.get_cmap('viridis')
@@ -150,44 +198,36 @@ def plot_small_multiples(capacities, decays, windows, by_cap, out_svg: str,
 
     for idx, cap in enumerate(capacities):
         ax = axes[idx]
-        val_mat, n_mat = build_matrix(decays, windows, by_cap.get(cap, {}))
+        val_mat, n_mat = by_cap[cap]
         if not np.all(np.isnan(val_mat)):
             has_any_val = True
         # Display heatmap
         im = ax.imshow(val_mat, aspect='auto', origin='upper', cmap=cmap, norm=norm)
 
-        # Annotate cells
-        for i, d in enumerate(decays):
-            for j, w in enumerate(windows):
-                val = val_mat[i, j]
-                n = n_mat[i, j]
-                if np.isnan(val):
-                    txt = '—'
-                    color = 'lightgray'
-                else:
-                    if metric == 'sequence_accuracy':
-                        txt = f"{val*100:.0f}%"
-                        color = 'white' if val >= 0.5 else 'black'
-                    else:
-                        txt = f"{val:.2g}"
-                        color = 'white' if val >= mid else 'black'
-                # include n unless investor mode
-                if (not investor_mode) and (n > 0) and (not np.isnan(val)):
-                    txt += f"\n(n={n})"
-                ax.text(j, i, txt, ha='center', va='center', fontsize=fs_anno, color=color)
+        # Annotate cells: text and contrast color are decided with array masks, then drawn in one flat pass
+        nan_mask = np.isnan(val_mat)
+        if metric == 'sequence_accuracy':
+            texts = [f"{v:.0f}%" for v in (val_mat * 100).ravel().tolist()]
+            light_from = 0.5
+        else:
+            texts = [f"{v:.2g}" for v in val_mat.ravel().tolist()]
+            light_from = mid
+        colors = np.where(nan_mask, 'lightgray', np.where(val_mat >= light_from, 'white', 'black')).ravel().tolist()
+        texts = ['—' if m else t for t, m in zip(texts, nan_mask.ravel().tolist())]
+        # include n unless investor mode
+        if not investor_mode:
+            show_n = (~nan_mask & (n_mat > 0)).ravel().tolist()
+            texts = [f"{t}\n(n={n})" if sn else t for t, sn, n in zip(texts, show_n, n_mat.ravel().tolist())]
+        for (i, j), txt, color in zip(np.ndindex(val_mat.shape), texts, colors):
+            ax.text(j, i, txt, ha='center', va='center', fontsize=fs_anno, color=color)
 
         # Optional: highlight best cell per panel
-        if highlight_best and not np.all(np.isnan(val_mat)):
-            try:
-                max_val = np.nanmax(val_mat)
-                locations = np.argwhere(val_mat == max_val)
-                if locations.size > 0:
-                    i_best, j_best = locations[0]
-                    rect = Rectangle((j_best - 0.5, i_best - 0.5), 1, 1,
-                                     fill=False, edgecolor=outline_color, linewidth=2.5)
-                    ax.add_patch(rect)
-            except Exception:
-                pass
+        best = best_cell(val_mat) if highlight_best else None
+        if best is not None:
+            i_best, j_best = best
+            rect = Rectangle((j_best - 0.5, i_best - 0.5), 1, 1,
+                             fill=False, edgecolor=outline_color, linewidth=2.5)
+            ax.add_patch(rect)
 
         # Axis ticks/labels
         ax.set_title(f"Capacity = {cap}", fontsize=fs_title)
@@ -216,18 +256,39 @@ def plot_small_multiples(capacities, decays, windows, by_cap, out_svg: str,
                  ha='center', va='bottom', fontsize=8 * font_scale, color='red')
 
     os.makedirs(os.path.dirname(out_svg), exist_ok=True)
-    fig.savefig(out_svg, format='svg')
+    # Drop the timestamp and pin the element-id salt (unless the user set one) so an unchanged
+    # figure produces byte-identical SVG, which the PNG cache below keys on
+    salt = matplotlib.rcParams['svg.hashsalt'] or 'neuroforge-small-multiples'
+    with matplotlib.rc_context({'svg.hashsalt': salt}):
+        fig.savefig(out_svg, format='svg', metadata={'Date': None})
     if not json_only:
         print(f"[small-multiples] metric={metric} investor_mode={investor_mode} outline_color={outline_color} font_scale={font_scale} cmap={'brand' if isinstance(cmap, LinearSegmentedColormap) and cmap.name=='brand_ramp' else 'viridis'}")
         print(f"[small-multiples] Wrote SVG: {out_svg}")
     if out_png:
+        # Rasterizing at 300 dpi is the slowest step; skip it when the SVG matches the one the
+        # existing PNG was rendered from (recorded in the <png>.hash sidecar)
+        with open(out_svg, 'rb') as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        hash_file = out_png + '.hash'
+        try:
+            with open(hash_file, 'r', encoding='utf-8') as f:
+                unchanged = f.read() == digest and os.path.exists(out_png)
+        except OSError:
+            unchanged = False
+        if unchanged:
+            if not json_only:
+                print(f"[small-multiples] PNG up to date: {out_png}")
+            return fig
         try:
             fig.savefig(out_png, format='png', dpi=300)
+            with open(hash_file, 'w', encoding='utf-8') as f:
+                f.write(digest)
             if not json_only:
                 print(f"[small-multiples] Wrote PNG: {out_png}")
         except Exception as e:
             if not json_only:
                 print(f"[small-multiples] WARN: failed to write PNG ({e})")
+    return fig
 
 
 def main():
@@ -243,6 +304,9 @@ def main():
     parser.add_argument('--investor-mode', action='store_true', help='Hide (n=...) annotations for investor-facing deck')
     parser.add_argument('--font-scale', type=float, default=1.0, help='Scale factor for titles/labels/annotations')
     parser.add_argument('--metric', type=str, default='sequence_accuracy', help='Metric column to visualize')
+    parser.add_argument('--metrics', nargs='+', default=None,
+                        help='Render several metric columns (aliases allowed) in one run, reusing one figure; '
+                             'writes SmallMultiples_<Metric>.svg/.png into the --out/--png-out directories')
     parser.add_argument('-P', '--deck-preset', action='store_true', help='Preset for deck export: investor-mode, font-scale=1.15, outline-color=#2E86DE')
     parser.add_argument('-Pa', action='store_true', help='Deck preset + accuracy metric')
     parser.add_argument('-Ps', action='store_true', help='Deck preset + strength metric')
@@ -254,7 +318,7 @@ def main():
     parser.set_defaults(highlight=True)
     args = parser.parse_args()
 
-    rows = read_summary_csv(args.summary)
+    columns = read_summary_csv(args.summary)
 
     # Apply metric aliases
     alias_map = {
@@ -283,11 +347,22 @@ def main():
     if shorthand_used:
         args.deck_preset = True
 
-    # Validate metric column existence, fallback to sequence_accuracy if missing
-    if rows and (args.metric not in rows[0]):
-        if not args.json_only:
-            print(f"[small-multiples] WARN: metric '{args.metric}' not found. Falling back to 'sequence_accuracy'.")
-        args.metric = 'sequence_accuracy'
+    # (metric, svg, png) per figure: the single --metric goes to --out/--png-out, each of --metrics
+    # to SmallMultiples_<Metric> beside them
+    jobs = []
+    for metric in ([alias_map.get(m, m) for m in args.metrics] if args.metrics else [args.metric]):
+        # Validate metric column existence, fallback to sequence_accuracy if missing
+        if metric not in columns:
+            if not args.json_only:
+                print(f"[small-multiples] WARN: metric '{metric}' not found. Falling back to 'sequence_accuracy'.")
+            metric = 'sequence_accuracy'
+        if args.metrics:
+            name = 'SmallMultiples_' + ''.join(part.title() for part in metric.split('_'))
+            out_svg = os.path.join(os.path.dirname(args.out), name + '.svg')
+            png_out = os.path.join(os.path.dirname(args.png_out), name + '.png') if args.png_out else None
+        else:
+            out_svg, png_out = args.out, (args.png_out if args.png_out else None)
+        jobs.append((metric, out_svg, png_out))
 
     # Apply deck preset (takes precedence)
     if args.deck_preset:
@@ -303,13 +378,6 @@ def main():
         args.outline_color = args.brand_color
         brand_cmap = make_brand_cmap(args.brand_color)
 
-    capacities, decays, windows, by_cap = prepare_grids(rows, args.metric)
-
-    if not capacities:
-        raise RuntimeError('No capacities found in summary CSV')
-    if not decays or not windows:
-        raise RuntimeError('Missing decays or seq_window values in summary CSV')
-
     # JSON logging helper
     def _logj(obj):
         if args.phase_c_log_json:
@@ -318,61 +386,66 @@ def main():
             except Exception:
                 pass
 
-    # Compute normalization range (to log it)
-    if args.metric == 'sequence_accuracy':
-        _vmin, _vmax = 0.0, 1.0
-    else:
-        _vmin, _vmax = compute_global_range(capacities, decays, windows, by_cap)
-
-    # Emit config + scale
-    _logj({
-        'event': 'config',
-        'summary_path': args.summary,
-        'out_svg': args.out,
-        'out_png': args.png_out or '',
-        'metric': args.metric,
-        'investor_mode': args.investor_mode,
-        'font_scale': args.font_scale,
-        'outline_color': args.outline_color,
-        'deck_preset': bool(args.deck_preset),
-        'cmap': 'brand' if (brand_cmap is not None) else 'viridis',
-        'json_only': bool(args.json_only)
-    })
-    _logj({'event': 'scale', 'vmin': _vmin, 'vmax': _vmax})
-
-    # Emit best cell per panel
-    for cap in capacities:
-        val_mat, n_mat = build_matrix(decays, windows, by_cap.get(cap, {}))
-        if np.all(np.isnan(val_mat)):
-            continue
-        try:
-            max_val = float(np.nanmax(val_mat))
-            locs = np.argwhere(val_mat == max_val)
-            i_best, j_best = (int(locs[0][0]), int(locs[0][1])) if locs.size > 0 else (None, None)
-            record = {
+    fig = None
+    for metric, out_svg, png_out in jobs:
+        capacities, decays, windows, by_cap = prepare_grids(columns, metric)
+
+        if not capacities:
+            raise RuntimeError('No capacities found in summary CSV')
+        if not decays or not windows:
+            raise RuntimeError('Missing decays or seq_window values in summary CSV')
+
+        # Compute normalization range (to log it)
+        if metric == 'sequence_accuracy':
+            _vmin, _vmax = 0.0, 1.0
+        else:
+            _vmin, _vmax = compute_global_range(by_cap)
+
+        # Emit config + scale
+        _logj({
+            'event': 'config',
+            'summary_path': args.summary,
+            'out_svg': out_svg,
+            'out_png': png_out or '',
+            'metric': metric,
+            'investor_mode': args.investor_mode,
+            'font_scale': args.font_scale,
+            'outline_color': args.outline_color,
+            'deck_preset': bool(args.deck_preset),
+            'cmap': 'brand' if (brand_cmap is not None) else 'viridis',
+            'json_only': bool(args.json_only)
+        })
+        _logj({'event': 'scale', 'vmin': _vmin, 'vmax': _vmax})
+
+        # Emit best cell per panel
+        for cap in capacities:
+            val_mat, n_mat = by_cap[cap]
+            best = best_cell(val_mat)
+            if best is None:
+                continue
+            i_best, j_best = best
+            _logj({
                 'event': 'panel_best',
                 'capacity': int(cap),
-                'value': max_val,
-                'decay': float(decays[i_best]) if i_best is not None else None,
-                'seq_window': int(windows[j_best]) if j_best is not None else None,
-                'n': int(n_mat[i_best, j_best]) if i_best is not None else None
-            }
-            _logj(record)
-        except Exception:
-            pass
-
-    png_out = args.png_out if args.png_out else None
-    plot_small_multiples(capacities, decays, windows, by_cap,
-                         args.out, png_out,
-                         args.highlight, args.outline_color,
-                         args.investor_mode, args.font_scale, args.metric,
-                         cmap=brand_cmap,
-                         json_only=args.json_only)
-
-    # Emit output completion markers
-    _logj({'event': 'output', 'type': 'svg', 'path': args.out})
-    if png_out:
-        _logj({'event': 'output', 'type': 'png', 'path': png_out})
+                'value': float(val_mat[i_best, j_best]),
+                'decay': float(decays[i_best]),
+                'seq_window': int(windows[j_best]),
+                'n': int(n_mat[i_best, j_best])
+            })
+
+        fig = plot_small_multiples(capacities, decays, windows, by_cap,
+                                   out_svg, png_out,
+                                   args.highlight, args.outline_color,
+                                   args.investor_mode, args.font_scale, metric,
+                                   cmap=brand_cmap,
+                                   json_only=args.json_only,
+                                   fig=fig,
+                                   value_range=(_vmin, _vmax))
+
+        # Emit output completion markers
+        _logj({'event': 'output', 'type': 'svg', 'path': out_svg})
+        if png_out:
+            _logj({'event': 'output', 'type': 'png', 'path': png_out})
     _logj({'event': 'done'})
 
 
@@ -3,43 +3,72 @@ import json
 import math
 from glob import glob
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 OUT_MD = os.path.join("docs", "Neuroforge_v0.17_Whitepaper.md")
 
+def _rolling_var(arr, window):
+    # Population variance of each trailing window (shorter at the start) in O(N):
+    # var = E[x^2] - E[x]^2 from prefix sums of x and x*x. Centering on the series mean
+    # first keeps the subtraction from cancelling when the values sit far from zero.
+    arr = arr - arr.mean()
+    cs = np.concatenate(([0.0], np.cumsum(arr)))
+    cs2 = np.concatenate(([0.0], np.cumsum(arr * arr)))
+    end = np.arange(1, arr.size + 1)
+    start = np.maximum(end - window, 0)
+    n = end - start
+    mean = (cs[end] - cs[start]) / n
+    return (cs2[end] - cs2[start]) / n - mean * mean
+
 def rolling_std(vals, window=100):
-    out = []
-    for i in range(len(vals)):
-        j0 = max(0, i - window + 1)
-        w = vals[j0:i+1]
-        if not w:
-            out.append(0.0)
-            continue
-        m = sum(w) / len(w)
-        var = sum((x - m) ** 2 for x in w) / len(w)
-        out.append(math.sqrt(var))
-    return out
+    arr = np.asarray(vals, dtype=np.float64)
+    if arr.size == 0:
+        return arr
+    return np.sqrt(np.maximum(_rolling_var(arr, window), 0.0))
+
+def rolling_std_max(vals, window=100):
+    # max(rolling_std) without the per-window sqrt: sqrt is monotonic, so take it once
+    arr = np.asarray(vals, dtype=np.float64)
+    if arr.size == 0:
+        return 0.0
+    return math.sqrt(max(float(_rolling_var(arr, window).max()), 0.0))
 
 def estimate_tau(vals, max_lag=200):
-    if not vals:
+    # First lag whose autocorrelation drops to 1/e. All lags come from one FFT
+    # (zero-padded to >= 2N so lags don't wrap around); lags >= N correlate to 0.
+    x = np.asarray(vals, dtype=np.float64)
+    if x.size == 0:
         return 0.0
-    m = sum(vals)/len(vals)
-    x = [v - m for v in vals]
-    var0 = sum(v*v for v in x)
+    x = x - x.mean()
+    var0 = float(x @ x)
     if var0 <= 0:
         return 0.0
-    target = 1.0 / math.e
-    for k in range(1, max_lag+1):
-        num = sum(x[i]*x[i-k] for i in range(k, len(x)))
-        den = var0
-        ac_k = num/den if den != 0 else 0.0
-        if ac_k <= target:
-            return float(k)
-    return float(max_lag)
+    nfft = 1 << (2 * x.size - 1).bit_length()
+    spec = np.fft.rfft(x, nfft)
+    ac = np.fft.irfft(spec * spec.conj(), nfft)[1:max_lag + 1] / var0
+    hits = np.flatnonzero(ac <= 1.0 / math.e)
+    return float(hits[0] + 1) if hits.size else float(max_lag)
+
+def _loads(data):
+    # orjson when available; stdlib also accepts the NaN/Infinity that json.dump writes
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 def load_ethics(path):
-    with open(path, "r", encoding="utf-8") as f:
-        obj = json.load(f)
+    with open(path, "rb") as f:
+        obj = _loads(f.read())
     logs = obj.get("ethics_regulator_log", [])
-    return [rec.get("risk") for rec in logs if rec.get("risk") is not None]
+    return np.fromiter((rec["risk"] for rec in logs if rec.get("risk") is not None), dtype=np.float64)
 
 def main():
     files = sorted(glob(os.path.join("web", "ethics_*_noise*.json")))
@@ -49,11 +78,9 @@ def main():
     tau_vals = []
     for p in files:
         risks = load_ethics(p)
-        if not risks:
+        if risks.size == 0:
             continue
-        sig = rolling_std(risks, window=100)
-        if sig:
-            sigma_vals.append(max(sig))
+        sigma_vals.append(rolling_std_max(risks, window=100))
         tau_vals.append(estimate_tau(risks))
 
     n_files = len(files)
@@ -2,7 +2,23 @@ import argparse
 import json
 import math
 import os
-import random
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _loads(data):
+    # orjson when available; stdlib also accepts the NaN/Infinity that json.dump writes
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 def main():
     p = argparse.ArgumentParser()
@@ -12,8 +28,8 @@ def main():
     p.add_argument("--clip", type=float, default=1.0, help="clip risk to [0, clip]")
     args = p.parse_args()
 
-    with open(args.inp, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(args.inp, "rb") as f:
+        data = _loads(f.read())
 
     # Inject Gaussian noise into ethics regulator log entries where risk is present
     count = 0
@@ -25,14 +41,19 @@ def main():
     else:
         logs = []
 
-    for rec in logs:
+    # Draw all noise at once and clamp as arrays; only the write-back walks the records.
+    # fmin/fmax pick the bound for NaN the way max(0, min(clip, x)) did.
+    idx = [i for i, rec in enumerate(logs)
+           if isinstance(rec, dict) and isinstance(rec.get("risk"), (int, float))]
+    risks = np.fromiter((logs[i]["risk"] for i in idx), dtype=np.float64, count=len(idx))
+    rng = np.random.default_rng()
+    # gauss() accepted a negative sigma (same distribution as its absolute value)
+    noisy = np.fmax(0.0, np.fmin(args.clip, risks + rng.normal(0.0, abs(args.std), risks.size)))
+
+    for i, new_risk in zip(idx, noisy.tolist()):
+        rec = logs[i]
         try:
             ctx = rec.get("context") or {}
-            risk = rec.get("risk")
-            if risk is None:
-                continue
-            noise = random.gauss(0.0, args.std)
-            new_risk = max(0.0, min(args.clip, risk + noise))
             rec["risk"] = new_risk
             ctx["noise_std"] = args.std
             rec["context"] = ctx
@@ -41,6 +62,7 @@ def main():
             continue
 
     os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    # stdlib writer: orjson would turn NaN/Infinity anywhere in the document into null
     with open(args.out, "w", encoding="utf-8") as f:
         json.dump(data, f)
 
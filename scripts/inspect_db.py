@@ -1,5 +1,20 @@
 import os, sqlite3, json, sys, traceback
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _loads(data):
+    # orjson when available; stdlib also accepts non-standard NaN/Infinity tokens
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 DB_NAME = os.environ.get("NF_DB", "phase5_baby_multimodal.sqlite")
 
 print("DB exists:", os.path.exists(DB_NAME), "path=", os.path.abspath(DB_NAME))
@@ -70,7 +85,7 @@ if 'reward_log' in tables:
             if json_col:
                 raw = rd.get(json_col)
                 try:
-                    j = json.loads(raw) if isinstance(raw, (str,bytes)) else raw
+                    j = _loads(raw) if isinstance(raw, (str,bytes)) else raw
                     keys = list(j.keys()) if isinstance(j, dict) else []
                     print("   json keys:", keys[:15])
                     # Common probes
@@ -99,7 +114,7 @@ if 'experiences' in tables:
         for r in rows:
             js = r[3]
             try:
-                j = json.loads(js) if isinstance(js, (str, bytes)) else js
+                j = _loads(js) if isinstance(js, (str, bytes)) else js
                 tname = type(j).__name__
             except Exception as e:
                 print(f" id={r[0]} step={r[1]} tag={r[2]} json_error={e}")
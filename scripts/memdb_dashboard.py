@@ -4,6 +4,12 @@ import json
 import sqlite3
 from typing import List, Dict, Any, Optional, Tuple
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from dash import Dash, dcc, html
     import plotly.express as px
@@ -51,6 +57,16 @@ def list_runs(con: sqlite3.Connection) -> List[Tuple[int, int]]:
     return cur.execute("SELECT id, started_ms FROM runs ORDER BY id DESC").fetchall()
 
 
+def _loads(data):
+    # orjson when available; stdlib also accepts non-standard NaN/Infinity tokens
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def fetch_experiences(con: sqlite3.Connection, run_id: int, tag: Optional[str] = None) -> List[Dict[str, Any]]:
     cur = con.cursor()
     if tag:
@@ -69,11 +85,11 @@ def fetch_experiences(con: sqlite3.Connection, run_id: int, tag: Optional[str] =
             "id": r[0], "ts_ms": r[1], "step": r[2], "tag": r[3], "significant": r[6]
         }
         try:
-            d["input"] = json.loads(r[4]) if r[4] else {}
+            d["input"] = _loads(r[4]) if r[4] else {}
         except Exception:
             d["input"] = {}
         try:
-            d["output"] = json.loads(r[5]) if r[5] else {}
+            d["output"] = _loads(r[5]) if r[5] else {}
         except Exception:
             d["output"] = {}
         out.append(d)
@@ -90,7 +106,7 @@ def fetch_reward_log(con: sqlite3.Connection, run_id: int) -> List[Dict[str, Any
     for r in rows:
         d: Dict[str, Any] = {"id": r[0], "ts_ms": r[1], "step": r[2], "reward": r[3], "source": r[4]}
         try:
-            d["context"] = json.loads(r[5]) if r[5] else {}
+            d["context"] = _loads(r[5]) if r[5] else {}
         except Exception:
             d["context"] = {}
         out.append(d)